@@ -38,7 +38,9 @@ class EventConsumer:
         queue_name: Optional[str] = None,
         prefetch_count: int = 1,
         max_retries: int = 5,
-        retry_delay: int = 2
+        retry_delay: int = 2,
+        ack_batch_size: int = 1,
+        ack_flush_interval: float = 1.0
     ):
         """
         Initialize event consumer
@@ -50,6 +52,10 @@ class EventConsumer:
             prefetch_count: Number of messages to prefetch
             max_retries: Maximum connection retry attempts
             retry_delay: Delay between retries in seconds
+            ack_batch_size: Acknowledge every N handled messages with one
+                multiple=True ack (1 acks each message individually)
+            ack_flush_interval: Seconds between acks of a partial batch, so
+                messages are not left unacked when the stream goes quiet
         """
         self.rabbitmq_url = rabbitmq_url
         self.exchange_name = exchange_name
@@ -60,6 +66,14 @@ class EventConsumer:
         self.connection: Optional[pika.BlockingConnection] = None
         self.channel: Optional[BlockingChannel] = None
         self.handlers: Dict[str, List[Callable]] = {}
+        # Handlers that receive an ack callable and acknowledge messages themselves
+        self._manual_ack_handlers: set = set()
+        self.ack_batch_size = max(1, ack_batch_size)
+        self.ack_flush_interval = ack_flush_interval
+        # Latest handled delivery tag not yet acked, and how many it covers
+        self._last_unacked_tag: Optional[int] = None
+        self._unacked_count = 0
+        self._ack_flush_connection: Optional[pika.BlockingConnection] = None
         
     def connect(self):
         """Establish connection to RabbitMQ with retry logic"""
@@ -156,12 +170,14 @@ class EventConsumer:
             except Exception as e:
                 logger.error(f"Failed to bind queue to {event_type}: {e}")
     
-    def subscribe(self, event_type: str):
+    def subscribe(self, event_type: str, manual_ack: bool = False):
         """
         Decorator to subscribe to an event type
         
         Args:
             event_type: Event type to subscribe to (e.g., "answer.generated")
+            manual_ack: Call the handler as handler(event, ack) and leave the
+                message unacked until it calls ack() (from any thread)
         
         Usage:
             @consumer.subscribe("answer.generated")
@@ -172,6 +188,8 @@ class EventConsumer:
             if event_type not in self.handlers:
                 self.handlers[event_type] = []
             self.handlers[event_type].append(handler)
+            if manual_ack:
+                self._manual_ack_handlers.add(handler)
             logger.info(f"Registered handler for: {event_type}")
             return handler
         return decorator
@@ -202,26 +220,93 @@ class EventConsumer:
             logger.info(f"Received event: {event.event_type} (id={event.event_id})")
             
             # Call registered handlers
+            manual_ack = False
             if event.event_type in self.handlers:
                 for handler in self.handlers[event.event_type]:
                     try:
-                        handler(event)
+                        if handler in self._manual_ack_handlers:
+                            manual_ack = True
+                            handler(event, self._threadsafe_ack(ch, method.delivery_tag))
+                        else:
+                            handler(event)
                     except Exception as e:
                         logger.error(
                             f"Handler error for {event.event_type}: {e}",
                             exc_info=True
                         )
+                        if manual_ack:
+                            # The handler did not take the message; let the broker redeliver it
+                            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+                            return
             
-            # Acknowledge message
-            ch.basic_ack(delivery_tag=method.delivery_tag)
+            # Acknowledge message (batched when ack_batch_size > 1) unless a handler will
+            if not manual_ack:
+                self._ack(ch, method.delivery_tag)
             
         except Exception as e:
             logger.error(f"Failed to process message: {e}", exc_info=True)
             # Reject and requeue
             ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
     
-    def start(self):
-        """Start consuming messages with automatic reconnection"""
+    def _ack(self, ch: BlockingChannel, delivery_tag: int) -> None:
+        """Acknowledge a handled message, batching up to ack_batch_size per ack."""
+        if self.ack_batch_size == 1:
+            ch.basic_ack(delivery_tag=delivery_tag)
+            return
+        # Manual acks from several threads can arrive slightly out of order
+        self._last_unacked_tag = max(delivery_tag, self._last_unacked_tag or 0)
+        self._unacked_count += 1
+        if self._unacked_count >= self.ack_batch_size:
+            self._flush_acks()
+
+    def _threadsafe_ack(self, ch: BlockingChannel, delivery_tag: int) -> Callable[[], None]:
+        """Return a callable that acks delivery_tag from any thread via the connection's I/O loop."""
+        connection = self.connection
+
+        def ack_on_loop():
+            # Tags from a channel lost to a reconnect are redelivered by the broker
+            if ch is self.channel and ch.is_open:
+                self._ack(ch, delivery_tag)
+
+        def ack():
+            try:
+                connection.add_callback_threadsafe(ack_on_loop)
+            except Exception as e:
+                logger.debug(f"Dropping ack for delivery {delivery_tag}: {e}")
+
+        return ack
+
+    def _flush_acks(self) -> None:
+        """Acknowledge every handled message up to the latest delivery tag."""
+        if self._last_unacked_tag is not None and self.channel and self.channel.is_open:
+            self.channel.basic_ack(delivery_tag=self._last_unacked_tag, multiple=True)
+        self._last_unacked_tag = None
+        self._unacked_count = 0
+
+    def _schedule_ack_flush(self) -> None:
+        """Periodically flush partial ack batches on the connection's I/O loop."""
+        if self._ack_flush_connection is self.connection:
+            return  # already scheduled on this connection
+        self._ack_flush_connection = connection = self.connection
+
+        def flush_and_reschedule():
+            try:
+                self._flush_acks()
+            finally:
+                if connection.is_open:
+                    connection.call_later(self.ack_flush_interval, flush_and_reschedule)
+
+        connection.call_later(self.ack_flush_interval, flush_and_reschedule)
+
+    def start(self, on_stop: Optional[Callable[[], None]] = None):
+        """
+        Start consuming messages with automatic reconnection
+
+        Args:
+            on_stop: Called once consumption stops (Ctrl-C/SIGTERM) and before
+                the last batched acks are sent, so handlers that buffer events
+                can persist them first
+        """
         if not self.channel:
             self.connect()
 
@@ -236,6 +321,13 @@ class EventConsumer:
                 # Ensure connection before consuming
                 self.ensure_connection()
 
+                # Delivery tags are per channel; unacked messages on a lost
+                # channel are redelivered by the broker
+                self._last_unacked_tag = None
+                self._unacked_count = 0
+                if self.ack_batch_size > 1:
+                    self._schedule_ack_flush()
+
                 self.channel.basic_consume(
                     queue=self.queue_name,
                     on_message_callback=self._handle_message
@@ -248,6 +340,12 @@ class EventConsumer:
                 logger.info("⏹️  Stopping consumer...")
                 if self.channel and not self.channel.is_closed:
                     self.channel.stop_consuming()
+                if on_stop is not None:
+                    on_stop()
+                if self.channel and not self.channel.is_closed:
+                    # Run acks handed over by other threads before the final flush
+                    self.connection.process_data_events(time_limit=0)
+                    self._flush_acks()
                 break
 
             except (AMQPConnectionError, AMQPChannelError, StreamLostError) as e:
@@ -41,6 +41,10 @@ class CorrelationIdFilter(logging.Filter):
 class StructuredFormatter(logging.Formatter):
     """Format logs with structured data for easy parsing."""
     
+    def __init__(self, json_output: bool = False):
+        super().__init__()
+        self.json_output = json_output
+    
     def format(self, record):
         # Create structured log entry
         log_data = {
@@ -58,7 +62,7 @@ class StructuredFormatter(logging.Formatter):
             log_data['exception'] = self.formatException(record.exc_info)
         
         # Return as JSON for unified log, human-readable for console
-        if hasattr(record, 'unified_format') and record.unified_format:
+        if self.json_output:
             return json.dumps(log_data)
         else:
             # Human-readable format for console
@@ -111,15 +115,7 @@ def setup_logging(
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         unified_handler = logging.FileHandler(UNIFIED_LOG_FILE)
         unified_handler.setLevel(logging.DEBUG)
-        
-        # Mark records for JSON formatting
-        class UnifiedFilter(logging.Filter):
-            def filter(self, record):
-                record.unified_format = True
-                return True
-        
-        unified_handler.addFilter(UnifiedFilter())
-        unified_handler.setFormatter(StructuredFormatter())
+        unified_handler.setFormatter(StructuredFormatter(json_output=True))
         logger.addHandler(unified_handler)
     
     # Service-specific log handler (human-readable)
@@ -9,4 +9,15 @@ They are split into:
 
 # Re-export for convenience
 from .input import *
-from .output import *
+from . import input as _input
+from . import output as _output
+
+__all__ = [*_input.__all__, *_output.__all__]
+
+
+def __getattr__(name):
+    # Resolve output adapters lazily instead of star-importing them, which
+    # would force every adapter module to load.
+    if name in _output.__all__:
+        return getattr(_output, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
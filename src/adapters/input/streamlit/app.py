@@ -9,15 +9,21 @@ import plotly.graph_objects as go
 from datetime import datetime
 
 from src.config import settings
-from src.factories import create_embeddings, build_service
+from src.factories import create_embeddings, build_service, warm_up_embeddings
 from src.core import RAGService
 from src.logging import configure_logging, get_logger
-from src.analytics import RLVRAnalytics
+from src.analytics.streamlit_cache import (
+    cached_basic_stats,
+    cached_rl_readiness,
+    clear_cached_analytics,
+    shared_analytics,
+)
 from src.utils import prepare_uploads
 
 
 configure_logging(level=settings.app.log_level_int)
 logger = get_logger(__name__)
+warm_up_embeddings()
 
 # Page config
 st.set_page_config(
@@ -173,7 +179,7 @@ def init_state():
     if "messages" not in st.session_state:
         st.session_state.messages = []
     if "analytics" not in st.session_state:
-        st.session_state.analytics = RLVRAnalytics()
+        st.session_state.analytics = shared_analytics()
 
 
 def render_sidebar():
@@ -242,7 +248,7 @@ def render_sidebar():
             st.rerun()
 
         if st.button("🔄 Refresh Analytics", use_container_width=True):
-            st.session_state.analytics = RLVRAnalytics()
+            clear_cached_analytics()
             st.rerun()
 
 
@@ -252,7 +258,7 @@ def render_dashboard_tab():
     st.caption("Real-time metrics and training progress visualization")
 
     analytics = st.session_state.analytics
-    stats = analytics.get_basic_stats()
+    stats = cached_basic_stats(analytics)
 
     # Top metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -417,7 +423,7 @@ def render_dashboard_tab():
         st.divider()
 
         # RL Readiness
-        readiness = analytics.estimate_rl_readiness()
+        readiness = cached_rl_readiness(analytics)
 
         st.markdown(f"""
         <div style="padding: 20px; background: #1E1E1E; border-radius: 10px; border-left: 4px solid {readiness['color']};">
@@ -541,9 +547,16 @@ def render_chat_tab():
         # Add user message
         st.session_state.messages.append({"role": "user", "content": question})
 
-        # Get answer
+        # Get answer, rendering tokens as they are generated
+        answer_placeholder = st.empty()
+        streamed: list[str] = []
+
+        def show_token(piece: str) -> None:
+            streamed.append(piece)
+            answer_placeholder.markdown("".join(streamed))
+
         with st.spinner("🤔 Thinking..."):
-            result = st.session_state.rag.answer_question(question)
+            result = st.session_state.rag.answer_question(question, on_token=show_token)
 
         # Add assistant message
         st.session_state.messages.append({
@@ -591,7 +604,7 @@ def render_settings_tab():
 
         st.subheader("📊 Training Data")
         analytics = st.session_state.analytics
-        stats = analytics.get_basic_stats()
+        stats = cached_basic_stats(analytics)
 
         st.info(f"""
         **Location:** `training_data/`
@@ -645,7 +658,7 @@ def render_settings_tab():
 
         st.subheader("🚀 Next Steps")
 
-        readiness = analytics.estimate_rl_readiness()
+        readiness = cached_rl_readiness(analytics)
 
         if readiness['total_interactions'] >= 500:
             st.success("""
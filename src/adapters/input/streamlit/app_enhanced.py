@@ -11,15 +11,21 @@ import base64
 from io import BytesIO
 
 from src.config import settings
-from src.factories import create_embeddings, build_service
+from src.factories import create_embeddings, build_service, warm_up_embeddings
 from src.core import RAGService
 from src.logging import configure_logging, get_logger
-from src.analytics import RLVRAnalytics
+from src.analytics.streamlit_cache import (
+    cached_basic_stats,
+    cached_rl_readiness,
+    clear_cached_analytics,
+    shared_analytics,
+)
 from src.utils import prepare_uploads
 
 
 configure_logging(level=settings.app.log_level_int)
 logger = get_logger(__name__)
+warm_up_embeddings()
 
 # Page config
 st.set_page_config(
@@ -368,14 +374,14 @@ def init_state():
     if "messages" not in st.session_state:
         st.session_state.messages = []
     if "analytics" not in st.session_state:
-        st.session_state.analytics = RLVRAnalytics()
+        st.session_state.analytics = shared_analytics()
 
 
 def render_executive_summary():
     """Render executive summary banner at the top."""
     analytics = st.session_state.analytics
-    stats = stats = analytics.get_basic_stats()
-    readiness = analytics.estimate_rl_readiness()
+    stats = cached_basic_stats(analytics)
+    readiness = cached_rl_readiness(analytics)
 
     total = stats['total_interactions']
     avg_score = stats['average_score']
@@ -478,7 +484,7 @@ def render_sidebar():
             st.rerun()
 
         if st.button("🔄 Refresh Analytics", use_container_width=True):
-            st.session_state.analytics = RLVRAnalytics()
+            clear_cached_analytics()
             st.rerun()
 
 
@@ -488,7 +494,7 @@ def render_dashboard_tab():
     st.caption("Real-time performance metrics and business intelligence")
 
     analytics = st.session_state.analytics
-    stats = analytics.get_basic_stats()
+    stats = cached_basic_stats(analytics)
 
     # Top metrics row with trends
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -584,7 +590,7 @@ def render_dashboard_tab():
     with col2:
         st.subheader("🎯 Key Insights")
 
-        readiness = analytics.estimate_rl_readiness()
+        readiness = cached_rl_readiness(analytics)
 
         if readiness['readiness'] == "Ready for Training":
             st.markdown("""
@@ -735,7 +741,7 @@ def render_dashboard_tab():
         st.divider()
 
         # RL Readiness with enhanced styling
-        readiness = analytics.estimate_rl_readiness()
+        readiness = cached_rl_readiness(analytics)
 
         border_color = {
             "red": "#f5576c",
@@ -917,9 +923,16 @@ def render_chat_tab():
         # Add user message
         st.session_state.messages.append({"role": "user", "content": question})
 
-        # Get answer
+        # Get answer, rendering tokens as they are generated
+        answer_placeholder = st.empty()
+        streamed: list[str] = []
+
+        def show_token(piece: str) -> None:
+            streamed.append(piece)
+            answer_placeholder.markdown("".join(streamed))
+
         with st.spinner("🤔 Thinking..."):
-            result = st.session_state.rag.answer_question(question)
+            result = st.session_state.rag.answer_question(question, on_token=show_token)
 
         # Add assistant message
         st.session_state.messages.append({
@@ -967,7 +980,7 @@ def render_settings_tab():
 
         st.subheader("📊 Training Data")
         analytics = st.session_state.analytics
-        stats = analytics.get_basic_stats()
+        stats = cached_basic_stats(analytics)
 
         st.info(f"""
         **Location:** `training_data/`
@@ -1022,7 +1035,7 @@ def render_settings_tab():
 
         st.subheader("🚀 Next Steps")
 
-        readiness = analytics.estimate_rl_readiness()
+        readiness = cached_rl_readiness(analytics)
 
         if readiness['total_interactions'] >= 500:
             st.success("""
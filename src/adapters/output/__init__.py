@@ -10,14 +10,26 @@ These adapters:
 - Abstract away third-party libraries
 """
 
-from .llm import ChatOllamaAdapter, ChatOpenAIAdapter
-from .embedding import (
-    SentenceTransformerAdapter,
-    HashingAdapter,
-    OpenAIEmbeddingAdapter,
-)
-from .vectorstore import QdrantAdapter
-from .verification import RagasAdapter
+import importlib
+
+# Adapters pull in heavy third-party stacks (torch, langchain, ragas, qdrant),
+# so each one is imported only when first accessed (PEP 562).
+_LAZY_EXPORTS = {
+    "ChatOllamaAdapter": ".llm",
+    "ChatOpenAIAdapter": ".llm",
+    "SentenceTransformerAdapter": ".embedding",
+    "HashingAdapter": ".embedding",
+    "OpenAIEmbeddingAdapter": ".embedding",
+    "QdrantAdapter": ".vectorstore",
+    "RagasAdapter": ".verification",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ChatOllamaAdapter",
@@ -1,11 +1,26 @@
 """Embedding Adapters - Concrete implementations of EmbeddingsPort."""
 
-from .sentence import SentenceTransformerAdapter
-from .hashing import HashingAdapter
-from .openai import OpenAIEmbeddingAdapter
+import importlib
+
+# Each backend is imported on first access so selecting one does not load the
+# others' dependencies (PEP 562).
+_LAZY_EXPORTS = {
+    "SentenceTransformerAdapter": ".sentence",
+    "start_background_warmup": ".sentence",
+    "HashingAdapter": ".hashing",
+    "OpenAIEmbeddingAdapter": ".openai",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "SentenceTransformerAdapter",
     "HashingAdapter",
     "OpenAIEmbeddingAdapter",
+    "start_background_warmup",
 ]
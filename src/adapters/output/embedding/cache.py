@@ -0,0 +1,95 @@
+"""Embedding Cache - Content-hash LRU shared by the neural embedding adapters."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+def _content_key(text: str) -> bytes:
+    """Hash text to a compact, fixed-size cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class EmbeddingCache:
+    """
+    In-memory LRU cache of embedding vectors keyed by text content hash.
+
+    PDFs repeat boilerplate (headers, footers, disclaimers) across pages,
+    so identical chunks are common within and across ingest calls. The cache
+    deduplicates a batch, embeds only the misses, and scatters results back
+    into the original order.
+
+    Vectors can be stored as float16 (``dtype="float16"``) to halve the
+    cache's memory; they are widened back to float32 on the way out. For
+    unit-length vectors the rounding error (~1e-3 per component) does not
+    change retrieval rankings in practice.
+    """
+
+    def __init__(self, maxsize: int = 100_000, dtype: str = "float32") -> None:
+        self.maxsize = maxsize
+        self.dtype = np.dtype(dtype)
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        # Guards _entries; embed_fn runs outside it so threads can encode concurrently
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def embed(
+        self,
+        texts: List[str],
+        embed_fn: Callable[[List[str]], np.ndarray],
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Embed texts, calling embed_fn only for unique texts not yet cached.
+
+        Args:
+            texts: Texts to embed (duplicates allowed)
+            embed_fn: Batch embedding function used for cache misses
+            out: Optional (len(texts), dim) float32 array to write rows into
+
+        Returns:
+            float32 array of embedding vectors, one row per text (``out``
+            when given)
+        """
+        keys = [_content_key(text) for text in texts]
+
+        found: dict[bytes, np.ndarray] = {}
+        misses: dict[bytes, str] = {}
+        with self._lock:
+            entries = self._entries
+            for key, text in zip(keys, texts):
+                if key in found or key in misses:
+                    continue
+                vector = entries.get(key)
+                if vector is None:
+                    misses[key] = text
+                else:
+                    entries.move_to_end(key)
+                    found[key] = vector
+
+        if misses:
+            vectors = embed_fn(list(misses.values()))
+            vectors = np.asarray(vectors).astype(self.dtype, copy=False)
+            new = dict(zip(misses, vectors))
+            found.update(new)
+            with self._lock:
+                self._entries.update(new)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        rows = [found[key] for key in keys]
+
+        if not rows:
+            return out if out is not None else np.empty((0, 0), dtype=np.float32)
+        if out is not None:
+            return np.stack(rows, out=out)
+        return np.stack(rows).astype(np.float32, copy=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
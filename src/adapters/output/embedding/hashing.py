@@ -1,6 +1,8 @@
 """Hashing Embedding Adapter - Lightweight, download-free embeddings."""
 
-from typing import List
+from typing import List, Sequence
+
+import numpy as np
 
 try:
     from langchain_core.embeddings import Embeddings
@@ -11,6 +13,8 @@ from sklearn.feature_extraction.text import HashingVectorizer
 
 from src.ports.output import EmbeddingsPort
 
+from .cache import EmbeddingCache
+
 
 class HashingAdapter(Embeddings, EmbeddingsPort):
     """
@@ -19,6 +23,9 @@ class HashingAdapter(Embeddings, EmbeddingsPort):
     Uses sklearn's hashing trick for fast, deterministic embeddings.
     No model download required - perfect for quick prototyping.
 
+    Vectors are kept as a float32 sparse CSR matrix internally and only
+    densified once, into a float32 ndarray.
+
     Trade-offs:
     - ✅ Extremely fast, no downloads
     - ✅ Deterministic (same text = same embedding)
@@ -33,15 +40,23 @@ class HashingAdapter(Embeddings, EmbeddingsPort):
             alternate_sign=False,
             norm="l2",
             ngram_range=(1, 2),
+            dtype=np.float32,
         )
+        self._query_cache = EmbeddingCache(maxsize=2048)
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+    def embed_documents(self, texts: Sequence[str]) -> np.ndarray:
         """Embed a list of documents using hashing."""
-        if isinstance(texts, str):
-            texts = [texts]
-        mat = self.vectorizer.transform(texts)
-        return mat.toarray().tolist()
+        return self.vectorizer.transform(texts).toarray()
+
+    def embed_documents_into(self, texts: Sequence[str], out: np.ndarray) -> np.ndarray:
+        """Densify the hashed documents straight into a preallocated float32 array."""
+        out.fill(0)  # scipy accumulates into the buffer rather than overwriting it
+        return self.vectorizer.transform(texts).toarray(out=out)
 
     def embed_query(self, query: str) -> List[float]:
         """Embed a single query using hashing."""
-        return self.embed_documents([query])[0]
+        return self._query_cache.embed([query], self.embed_documents)[0].tolist()
+
+    def embed_queries(self, queries: Sequence[str]) -> np.ndarray:
+        """Embed several queries using hashing."""
+        return self._query_cache.embed(list(queries), self.embed_documents)
@@ -1,6 +1,8 @@
 """OpenAI Embedding Adapter - Cloud embeddings via OpenAI API."""
 
-from typing import List
+from typing import List, Sequence
+
+import numpy as np
 
 try:
     from langchain_core.embeddings import Embeddings
@@ -12,6 +14,8 @@ from langchain_openai import OpenAIEmbeddings
 from src.config import settings
 from src.ports.output import EmbeddingsPort
 
+from .cache import EmbeddingCache
+
 
 class OpenAIEmbeddingAdapter(Embeddings, EmbeddingsPort):
     """
@@ -26,6 +30,9 @@ class OpenAIEmbeddingAdapter(Embeddings, EmbeddingsPort):
     - ✅ Works on Streamlit Cloud
     - ❌ Costs money (~$0.02 per 1M tokens)
     - ❌ Requires API key
+
+    Repeated chunks and repeated questions are embedded once and served
+    from a content-hash cache, so the same text is not billed twice.
     """
 
     def __init__(self) -> None:
@@ -34,11 +41,26 @@ class OpenAIEmbeddingAdapter(Embeddings, EmbeddingsPort):
             model=settings.llm.openai.embedding_model,
             api_key=settings.llm.openai.api_key,
         )
+        self._cache = EmbeddingCache(dtype=settings.embedding.cache_dtype)
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        """Embed a list of documents via OpenAI API."""
-        return self.client.embed_documents(list(texts))
+    def embed_documents(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed a list of documents via OpenAI API, skipping texts already embedded."""
+        return self._cache.embed(list(texts), self._encode)
+
+    def embed_documents_into(self, texts: Sequence[str], out: np.ndarray) -> np.ndarray:
+        """Embed documents into a preallocated float32 array."""
+        return self._cache.embed(list(texts), self._encode, out=out)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Embed texts via OpenAI API as unit-length float32 vectors."""
+        vectors = np.asarray(self.client.embed_documents(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
 
     def embed_query(self, query: str) -> List[float]:
         """Embed a single query via OpenAI API."""
-        return self.client.embed_query(query)
+        return self._cache.embed([query], self._encode)[0].tolist()
+
+    def embed_queries(self, queries: Sequence[str]) -> np.ndarray:
+        """Embed several queries via OpenAI API."""
+        return self._cache.embed(list(queries), self._encode)
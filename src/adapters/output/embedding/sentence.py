@@ -1,9 +1,12 @@
 """Sentence Transformer Embedding Adapter - Local embeddings via sentence-transformers."""
 
+import os
+import threading
 from functools import lru_cache
-from typing import List
+from typing import List, Sequence
 from urllib.parse import urlparse
 
+import numpy as np
 from langchain_community.embeddings import SentenceTransformerEmbeddings
 
 try:
@@ -15,13 +18,66 @@ from src.config import settings
 from src.logging import get_logger
 from src.ports.output import EmbeddingsPort
 
+from .cache import EmbeddingCache
+
 logger = get_logger(__name__)
 
+# One model per Streamlit server process (shared across sessions and reruns);
+# plain process-level memoization outside Streamlit.
+try:
+    import streamlit as st
+    _cache_model = st.cache_resource(show_spinner=False)
+except Exception:  # pragma: no cover - optional dependency handling
+    _cache_model = lru_cache(maxsize=1)
+
 
-@lru_cache(maxsize=1)
+def _configure_torch_threads() -> None:
+    """Pin torch intra-op threads (EMBEDDING_NUM_THREADS, default: all cores)."""
+    try:
+        import torch
+    except ImportError:  # pragma: no cover - torch ships with sentence-transformers
+        return
+    num_threads = settings.embedding.num_threads or os.cpu_count() or 1
+    torch.set_num_threads(num_threads)
+    logger.info("Using %d torch threads for embeddings", num_threads)
+
+
+def _optimize_model(model: SentenceTransformerEmbeddings) -> None:
+    """Apply the EMBEDDING_RUNTIME optimization (torch | fp16 | bettertransformer)."""
+    runtime = settings.embedding.runtime.lower()
+    if runtime == "torch":
+        return
+
+    st_model = getattr(model, "client", None)
+    if st_model is None:
+        logger.warning("Embedding model exposes no underlying client; ignoring EMBEDDING_RUNTIME=%s", runtime)
+        return
+
+    if runtime == "fp16":
+        import torch
+        if not torch.cuda.is_available():
+            logger.warning("EMBEDDING_RUNTIME=fp16 requires CUDA; keeping fp32 weights on CPU")
+            return
+        st_model.half()
+        logger.info("Converted embedding model to fp16")
+    elif runtime == "bettertransformer":
+        try:
+            from optimum.bettertransformer import BetterTransformer
+        except ImportError:
+            logger.warning("EMBEDDING_RUNTIME=bettertransformer requires the 'optimum' package; using torch")
+            return
+        transformer = st_model[0]
+        transformer.auto_model = BetterTransformer.transform(transformer.auto_model)
+        logger.info("Converted embedding model to BetterTransformer (fused attention)")
+    else:
+        logger.warning("Unknown EMBEDDING_RUNTIME=%s; use 'torch', 'fp16', or 'bettertransformer'", runtime)
+
+
+@_cache_model
 def load_embedding_model() -> SentenceTransformerEmbeddings:
     """Load sentence-transformer model (cached for reuse)."""
     logger.info("Loading embedding model %s", settings.embedding.model_name)
+    _configure_torch_threads()
 
     # Shim for huggingface_hub>=0.36 where cached_download was removed
     try:
@@ -57,7 +113,36 @@ def load_embedding_model() -> SentenceTransformerEmbeddings:
     except Exception as exc:  # pragma: no cover - defensive fallback
         logger.warning("Could not patch huggingface_hub cached_download: %s", exc)
 
-    return SentenceTransformerEmbeddings(model_name=settings.embedding.model_name)
+    model = SentenceTransformerEmbeddings(model_name=settings.embedding.model_name)
+    _optimize_model(model)
+
+    # Run one forward pass so kernel setup is not paid by the first user request
+    model.embed_query("warmup")
+    return model
+
+
+_warmup_thread: threading.Thread | None = None
+_warmup_lock = threading.Lock()
+
+
+def start_background_warmup() -> threading.Thread:
+    """
+    Load and warm up the embedding model on a daemon thread (once per process).
+
+    Called at app startup so the model download/load overlaps with UI setup
+    instead of blocking the first request; later callers of
+    load_embedding_model() wait on the same cached load.
+    """
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(
+                target=load_embedding_model,
+                name="embedding-warmup",
+                daemon=True,
+            )
+            _warmup_thread.start()
+    return _warmup_thread
 
 
 class SentenceTransformerAdapter(Embeddings, EmbeddingsPort):
@@ -68,18 +153,35 @@ class SentenceTransformerAdapter(Embeddings, EmbeddingsPort):
     Supports models like multi-qa-mpnet-base-dot-v1, all-MiniLM-L6-v2, etc.
 
     Works on Streamlit Cloud (pure Python, no Docker required).
+
+    Repeated chunks and repeated questions are embedded once and served
+    from a content-hash cache.
     """
 
     def __init__(self) -> None:
         super().__init__()
         self.model = load_embedding_model()
+        self._cache = EmbeddingCache(dtype=settings.embedding.cache_dtype)
+
+    def embed_documents(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed a list of documents, skipping texts already embedded."""
+        return self._cache.embed(list(texts), self._encode)
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        """Embed a list of documents."""
-        if isinstance(texts, str):
-            texts = [texts]
-        return self.model.embed_documents(texts)
+    def embed_documents_into(self, texts: Sequence[str], out: np.ndarray) -> np.ndarray:
+        """Embed documents into a preallocated float32 array."""
+        return self._cache.embed(list(texts), self._encode, out=out)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts straight to unit-length float32 vectors (no Python float lists)."""
+        texts = [text.replace("\n", " ") for text in texts]
+        encode_kwargs = {**self.model.encode_kwargs, "normalize_embeddings": True}
+        vectors = self.model.client.encode(texts, convert_to_numpy=True, **encode_kwargs)
+        return vectors.astype(np.float32, copy=False)
 
     def embed_query(self, query: str) -> List[float]:
         """Embed a single query."""
-        return self.model.embed_query(query)
+        return self._cache.embed([query], self._encode)[0].tolist()
+
+    def embed_queries(self, queries: Sequence[str]) -> np.ndarray:
+        """Embed several queries."""
+        return self._cache.embed(list(queries), self._encode)
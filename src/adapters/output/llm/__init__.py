@@ -1,9 +1,23 @@
 """LLM Adapters - Concrete implementations of LLMPort."""
 
-from .ollama import ChatOllamaAdapter
-from .openai import ChatOpenAIAdapter
+import importlib
+
+# Each backend is imported on first access (PEP 562).
+_LAZY_EXPORTS = {
+    "ChatOllamaAdapter": ".ollama",
+    "ChatOpenAIAdapter": ".openai",
+    "CachedLLMAdapter": ".cache",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ChatOllamaAdapter",
     "ChatOpenAIAdapter",
+    "CachedLLMAdapter",
 ]
@@ -0,0 +1,84 @@
+"""Shared LangChain chat model plumbing for the LLM adapters."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Sequence
+
+from src.ports.output import LLMPort
+
+
+class _LangChainChatAdapter(LLMPort):
+    """
+    Base for adapters wrapping a LangChain chat model in ``self.client``.
+
+    Subclasses only build the client in ``__init__``; invocation, batching,
+    streaming and the LCEL helpers are delegated to it here.
+    """
+
+    client: object
+
+    # invoke() honours per-call temperature/seed (used for RLVR candidate diversity)
+    supports_sampling = True
+
+    def invoke(self, inputs, temperature: Optional[float] = None, seed: Optional[int] = None) -> object:
+        """Invoke the chat model with given inputs and optional sampling overrides."""
+        return self._sampling_client(temperature, seed).invoke(inputs)
+
+    def invoke_batch(
+        self,
+        inputs: Sequence,
+        temperatures: Optional[Sequence[Optional[float]]] = None,
+        seeds: Optional[Sequence[Optional[int]]] = None,
+        return_exceptions: bool = False,
+    ) -> List[object]:
+        """Invoke the chat model on several inputs concurrently, with optional per-input sampling."""
+        if temperatures is None and seeds is None:
+            return self.client.batch(list(inputs), return_exceptions=return_exceptions)
+
+        temperatures = temperatures or [None] * len(inputs)
+        seeds = seeds or [None] * len(inputs)
+
+        def call(args):
+            prompt, temperature, seed = args
+            try:
+                return self.invoke(prompt, temperature=temperature, seed=seed)
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                return exc
+
+        with ThreadPoolExecutor(max_workers=max(1, len(inputs))) as executor:
+            return list(executor.map(call, zip(inputs, temperatures, seeds)))
+
+    def _sampling_client(self, temperature: Optional[float], seed: Optional[int]):
+        """Return the client, or a shallow copy with temperature/seed overridden."""
+        updates = {key: value for key, value in (("temperature", temperature), ("seed", seed)) if value is not None}
+        if not updates:
+            return self.client
+        # pydantic v2 models expose model_copy; older langchain releases only copy
+        copy = getattr(self.client, "model_copy", None) or self.client.copy
+        return copy(update=updates)
+
+    def stream(self, inputs) -> Iterator[str]:
+        """Stream the chat model response as text chunks."""
+        for chunk in self.client.stream(inputs):
+            yield getattr(chunk, "content", str(chunk))
+
+    async def ainvoke(self, inputs) -> object:
+        """Invoke the chat model asynchronously with given inputs."""
+        return await self.client.ainvoke(inputs)
+
+    def batch(self, inputs, **kwargs) -> list:
+        """Invoke the chat model on a list of inputs."""
+        return self.client.batch(inputs, **kwargs)
+
+    def bind(self, **kwargs):
+        """Return the underlying runnable bound to extra model kwargs."""
+        return self.client.bind(**kwargs)
+
+    def with_structured_output(self, schema, **kwargs):
+        """Return the underlying runnable constrained to a structured schema."""
+        return self.client.with_structured_output(schema, **kwargs)
+
+    def __or__(self, other):
+        """Pipe the underlying client into another runnable (LCEL)."""
+        return self.client | other
@@ -0,0 +1,145 @@
+"""LLM Response Cache - Content-addressed SQLite cache wrapping any LLM adapter."""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage
+
+from src.logging import get_logger
+from src.ports.output import LLMPort
+
+logger = get_logger(__name__)
+
+
+class CachedLLMAdapter(LLMPort):
+    """
+    LLMPort wrapper that memoizes deterministic responses in SQLite.
+
+    Responses are keyed by a hash of the inputs, model id and temperature, so
+    re-asking an identical prompt (demos, repeated evaluation runs) returns
+    instantly. Calls at temperature 0, or with no temperature set on the call
+    or the adapter (the default QA path), are cached; sampled calls (RLVR
+    candidates at temperature > 0) always reach the model. Cached hits are returned as ``AIMessage`` objects
+    carrying the original answer text.
+
+    Everything other than invoke/invoke_batch (stream, batch, bind, ...) is
+    delegated to the wrapped adapter unchanged.
+    """
+
+    def __init__(self, llm: LLMPort, path: str = ".cache/llm_cache.sqlite3"):
+        self.llm = llm
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        client = getattr(llm, "client", llm)
+        self.model_id = str(getattr(client, "model_name", None) or getattr(client, "model", "") or type(llm).__name__)
+        self._default_temperature = getattr(client, "temperature", None)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+        logger.info("LLM response cache enabled at %s (model=%s)", self.path, self.model_id)
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined on the wrapper
+        return getattr(self.llm, name)
+
+    def invoke(self, inputs, temperature: Optional[float] = None, seed: Optional[int] = None) -> object:
+        """Return the cached response for deterministic calls, invoking the wrapped LLM on a miss."""
+        key = self._key(inputs, temperature)
+        if key is not None:
+            cached = self._get(key)
+            if cached is not None:
+                return AIMessage(content=cached)
+        if temperature is None and seed is None:
+            response = self.llm.invoke(inputs)
+        else:
+            response = self.llm.invoke(inputs, temperature=temperature, seed=seed)
+        if key is not None:
+            self._put(key, response)
+        return response
+
+    def invoke_batch(
+        self,
+        inputs: Sequence,
+        temperatures: Optional[Sequence[Optional[float]]] = None,
+        seeds: Optional[Sequence[Optional[int]]] = None,
+        return_exceptions: bool = False,
+    ) -> List[object]:
+        """Serve cached responses and batch only the misses through the wrapped LLM."""
+        temperatures = list(temperatures) if temperatures is not None else [None] * len(inputs)
+        seeds = list(seeds) if seeds is not None else [None] * len(inputs)
+        keys = [self._key(prompt, temperature) for prompt, temperature in zip(inputs, temperatures)]
+
+        results: List[object] = [None] * len(inputs)
+        misses: List[int] = []
+        for i, key in enumerate(keys):
+            cached = self._get(key) if key is not None else None
+            if cached is None:
+                misses.append(i)
+            else:
+                results[i] = AIMessage(content=cached)
+
+        if misses:
+            responses = self.llm.invoke_batch(
+                [inputs[i] for i in misses],
+                temperatures=None if all(t is None for t in temperatures) else [temperatures[i] for i in misses],
+                seeds=None if all(s is None for s in seeds) else [seeds[i] for i in misses],
+                return_exceptions=return_exceptions,
+            )
+            for i, response in zip(misses, responses):
+                results[i] = response
+                if keys[i] is not None and not isinstance(response, Exception):
+                    self._put(keys[i], response)
+        return results
+
+    def stream(self, inputs) -> Iterator[str]:
+        """Stream from the wrapped LLM (streamed answers are not cached)."""
+        return self.llm.stream(inputs)
+
+    async def ainvoke(self, inputs) -> object:
+        """Invoke the wrapped LLM asynchronously (not cached)."""
+        return await self.llm.ainvoke(inputs)
+
+    def __or__(self, other):
+        """Pipe the wrapped LLM into another runnable (LCEL)."""
+        return self.llm | other
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def _key(self, inputs, temperature: Optional[float]) -> Optional[str]:
+        """Content hash for a cacheable call, or None when the call samples."""
+        if temperature is not None:
+            effective = temperature
+        else:
+            # No override: the adapter's own setting applies; an unset
+            # temperature (e.g. ChatOllama on the QA path) counts as cacheable
+            effective = self._default_temperature or 0.0
+        if effective > 0:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(inputs).encode("utf-8"))
+        digest.update(b"\0" + self.model_id.encode("utf-8"))
+        digest.update(b"\0" + repr(float(effective)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _put(self, key: str, response) -> None:
+        answer = getattr(response, "content", response)
+        if not isinstance(answer, str):
+            answer = str(answer)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, answer))
+            self._conn.commit()
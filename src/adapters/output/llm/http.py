@@ -0,0 +1,34 @@
+"""Shared HTTP connection pool for the OpenAI chat clients."""
+
+import atexit
+from functools import lru_cache
+
+import httpx
+
+from src.logging import get_logger
+
+logger = get_logger(__name__)
+
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+@lru_cache(maxsize=1)
+def shared_http_client() -> httpx.Client:
+    """
+    Return the process-wide httpx client used by every ChatOpenAI instance.
+
+    The generation LLM, its per-call sampling copies and the RAGAS judge all
+    reuse one keep-alive pool, so TLS/TCP handshakes to the API are paid once
+    per connection rather than per client. HTTP/2 is enabled when the
+    optional ``h2`` package is installed.
+    """
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    logger.info("Creating shared HTTP client for OpenAI (http2=%s)", http2)
+    client = httpx.Client(http2=http2, limits=_LIMITS, timeout=_TIMEOUT)
+    atexit.register(client.close)
+    return client
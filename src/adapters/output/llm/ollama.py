@@ -3,10 +3,11 @@
 from langchain_ollama import ChatOllama
 
 from src.config import settings
-from src.ports.output import LLMPort
 
+from .base import _LangChainChatAdapter
 
-class ChatOllamaAdapter(LLMPort):
+
+class ChatOllamaAdapter(_LangChainChatAdapter):
     """
     LLM adapter for Ollama Chat models.
 
@@ -19,11 +20,3 @@ class ChatOllamaAdapter(LLMPort):
             base_url=settings.llm.ollama.base_url,
             model=settings.llm.ollama.model
         )
-
-    def invoke(self, inputs) -> object:
-        """Invoke Ollama chat model with given inputs."""
-        return self.client.invoke(inputs)
-
-    def __getattr__(self, item):
-        """Proxy other attributes to underlying client."""
-        return getattr(self.client, item)
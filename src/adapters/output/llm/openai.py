@@ -3,10 +3,12 @@
 from langchain_openai import ChatOpenAI
 
 from src.config import settings
-from src.ports.output import LLMPort
 
+from .base import _LangChainChatAdapter
+from .http import shared_http_client
 
-class ChatOpenAIAdapter(LLMPort):
+
+class ChatOpenAIAdapter(_LangChainChatAdapter):
     """
     LLM adapter for OpenAI Chat models.
 
@@ -19,12 +21,5 @@ class ChatOpenAIAdapter(LLMPort):
             model=settings.llm.openai.model,
             api_key=settings.llm.openai.api_key,
             temperature=0,
+            http_client=shared_http_client(),
         )
-
-    def invoke(self, inputs) -> object:
-        """Invoke OpenAI chat model with given inputs."""
-        return self.client.invoke(inputs)
-
-    def __getattr__(self, item):
-        """Proxy other attributes to underlying client."""
-        return getattr(self.client, item)
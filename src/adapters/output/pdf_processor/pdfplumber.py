@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import io
 import re
-from typing import List
+from typing import Iterator, List, Optional
 
 import pdfplumber
 import pypdf
@@ -25,36 +25,67 @@ from src.ports.output import PDFProcessorPort
 logger = get_logger(__name__)
 
 
+# Single-character fixes in one pass: drop nulls, blank out control chars
+# (keeping tab/newline/CR), and map the malformed rupee "¹" to "₹".
+_CHAR_FIXES = str.maketrans(
+    {
+        0: None,
+        **{c: " " for c in range(1, 32) if c not in (9, 10, 13)},
+        "¹": "₹",
+    }
+)
+# CID artifacts - common PDF encoding issues: (cid:XXX), CID:XXX), or a dangling (cid:
+_CID_RE = re.compile(r"\(cid:\d+\)|cid:\d+\)|\(cid:", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _clean_text(raw: str) -> str:
     """Remove nulls, control chars, and CID artifacts that hurt tokenization/relevance."""
     if not raw:
         return ""
 
-    # Remove null bytes and control characters
-    cleaned = raw.replace("\x00", "")
-    cleaned = re.sub(r"[\x01-\x08\x0b-\x0c\x0e-\x1f]", " ", cleaned)
-
-    # Remove CID artifacts - common PDF encoding issues
-    # Pattern: (cid:XXX) or CID:XXX or similar
-    cleaned = re.sub(r'\(cid:\d+\)', '', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'CID:\d+\)', '', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'\(cid:', '', cleaned, flags=re.IGNORECASE)
-
-    # Common replacements for Indian currency
-    # Replace malformed rupee symbols
-    cleaned = re.sub(r'¹\s*\(cid:0\)', '₹', cleaned)
-    cleaned = re.sub(r'¹', '₹', cleaned)  # Sometimes ¹ is used for ₹
+    cleaned = raw.translate(_CHAR_FIXES)
+    cleaned = _CID_RE.sub("", cleaned)
 
     # Clean up extra spaces created by removals
-    cleaned = re.sub(r'\s+', ' ', cleaned)
-    cleaned = cleaned.strip()
-
-    return cleaned
+    return _WHITESPACE_RE.sub(" ", cleaned).strip()
 
 
 def extract_text_from_pdf(file_bytes: bytes) -> List[dict]:
     """Extract text per page to keep page metadata."""
-    pages: list[dict] = []
+    return list(iter_pdf_pages(file_bytes))
+
+
+def iter_pdf_pages(file_bytes: bytes) -> Iterator[dict]:
+    """
+    Yield {"page", "text"} per page as it is extracted.
+
+    Leading blank pages are held back until a page with text shows up; if
+    pdfplumber finds no text at all, the pages come from pypdf instead (or
+    stay the blank pdfplumber pages when that fallback fails too).
+    """
+    blank_pages: list[dict] = []
+    pages = _iter_pdfplumber_pages(file_bytes)
+    for page in pages:
+        if not page["text"].strip():
+            blank_pages.append(page)
+            continue
+        yield from blank_pages
+        yield page
+        yield from pages
+        return
+
+    # Fallback to pypdf if pdfplumber yielded only blanks
+    logger.info("pdfplumber returned empty text; falling back to pypdf extractor")
+    try:
+        fallback_pages = list(_iter_pypdf_pages(file_bytes))
+    except Exception as exc:
+        logger.error("Fallback pypdf extraction failed: %s", exc)
+        fallback_pages = blank_pages
+    yield from fallback_pages
+
+
+def _iter_pdfplumber_pages(file_bytes: bytes) -> Iterator[dict]:
     with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
         for idx, page in enumerate(pdf.pages):
             try:
@@ -62,24 +93,18 @@ def extract_text_from_pdf(file_bytes: bytes) -> List[dict]:
             except Exception as exc:
                 logger.warning("Failed to extract text from page %s: %s", idx + 1, exc)
                 text = ""
-            pages.append({"page": idx + 1, "text": text})
+            yield {"page": idx + 1, "text": text}
 
-    # Fallback to pypdf if pdfplumber yielded only blanks
-    if all((p["text"] or "").strip() == "" for p in pages):
-        logger.info("pdfplumber returned empty text; falling back to pypdf extractor")
+
+def _iter_pypdf_pages(file_bytes: bytes) -> Iterator[dict]:
+    reader = pypdf.PdfReader(io.BytesIO(file_bytes))
+    for idx, page in enumerate(reader.pages):
         try:
-            reader = pypdf.PdfReader(io.BytesIO(file_bytes))
-            pages = []
-            for idx, page in enumerate(reader.pages):
-                try:
-                    text = _clean_text(page.extract_text() or "")
-                except Exception as exc:
-                    logger.warning("pypdf failed on page %s: %s", idx + 1, exc)
-                    text = ""
-                pages.append({"page": idx + 1, "text": text})
+            text = _clean_text(page.extract_text() or "")
         except Exception as exc:
-            logger.error("Fallback pypdf extraction failed: %s", exc)
-    return pages
+            logger.warning("pypdf failed on page %s: %s", idx + 1, exc)
+            text = ""
+        yield {"page": idx + 1, "text": text}
 
 
 class PDFPlumberAdapter(PDFProcessorPort):
@@ -88,35 +113,43 @@ class PDFPlumberAdapter(PDFProcessorPort):
 
     Uses pdfplumber for text extraction with pypdf as fallback.
     Applies CID artifact cleaning and text chunking.
+
+    Args:
+        chunk_size: Fixed chunk size; defaults to settings.chunk.size at call time
+        chunk_overlap: Fixed chunk overlap; defaults to settings.chunk.overlap at call time
     """
 
+    def __init__(self, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None):
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
     def chunk(self, file_bytes: bytes, source_name: str) -> List[Document]:
-        pages = extract_text_from_pdf(file_bytes)
+        return list(self.chunk_stream(file_bytes, source_name))
+
+    def chunk_stream(self, file_bytes: bytes, source_name: str) -> Iterator[Document]:
+        """Yield chunks page by page while the PDF is still being parsed."""
+        chunk_size = self.chunk_size or settings.chunk.size
+        chunk_overlap = settings.chunk.overlap if self.chunk_overlap is None else self.chunk_overlap
         logger.info(
-            "Chunking %d pages from source=%s (size=%d, overlap=%d)",
-            len(pages),
+            "Chunking source=%s (size=%d, overlap=%d)",
             source_name,
-            settings.chunk.size,
-            settings.chunk.overlap,
+            chunk_size,
+            chunk_overlap,
         )
         splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.chunk.size,
-            chunk_overlap=settings.chunk.overlap,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
             separators=["\n\n", "\n", ". ", " ", ""],
         )
-        docs: list[Document] = []
-        for page in pages:
+        for page in iter_pdf_pages(file_bytes):
             chunks = splitter.split_text(page["text"])
             for chunk in chunks:
                 if not chunk.strip():
                     continue
-                docs.append(
-                    Document(
-                        page_content=chunk,
-                        metadata={
-                            "source": source_name,
-                            "page": page["page"],
-                        },
-                    )
+                yield Document(
+                    page_content=chunk,
+                    metadata={
+                        "source": source_name,
+                        "page": page["page"],
+                    },
                 )
-        return docs
@@ -6,15 +6,22 @@ It computes a numeric reward (0.0 to 1.0) based on price range overlap with grou
 """
 
 import re
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from src.config.ground_truth import TAJ_PRICE_TRUTH
+from src.config.ground_truth import HOTEL_NAME_TO_KEY, TAJ_PRICE_TRUTH
 from src.config.ground_truth.taj_hotels_pricing import TAJ_HOTEL_ALIASES
 from src.logging import get_logger
 from src.ports.output.reward import RewardPort
 
 logger = get_logger(__name__)
 
+# Digit runs with optional thousands separators: ₹24,000 / Rs 24000 / 24,000
+_PRICE_NUMBER_RE = re.compile(r"\d[\d,]*")
+
+# Reasonable hotel price bounds (per night, INR)
+_MIN_PRICE = 1000
+_MAX_PRICE = 500000
+
 
 class PricingRewardAdapter(RewardPort):
     """
@@ -31,6 +38,13 @@ class PricingRewardAdapter(RewardPort):
         self.price_truth = TAJ_PRICE_TRUTH
         self.hotel_aliases = TAJ_HOTEL_ALIASES
 
+        # One alternation over every alias and canonical key (longest names
+        # first) so lookup is a single scan.
+        self._hotel_lookup = HOTEL_NAME_TO_KEY
+        self._hotel_pattern = re.compile(
+            "|".join(re.escape(name) for name in sorted(self._hotel_lookup, key=len, reverse=True))
+        )
+
     def compute_reward(self, question: str, answer: str) -> float:
         """
         Compute pricing reward for an answer.
@@ -44,6 +58,34 @@ class PricingRewardAdapter(RewardPort):
         """
         # Step 1: Identify which hotel is being asked about
         hotel_key = self._normalize_hotel_name(question + " " + answer)
+        return self._reward_for_hotel(hotel_key, answer)
+
+    def compute_reward_batch(self, question: str, answers: Sequence[str]) -> List[float]:
+        """
+        Compute pricing rewards for several candidate answers to one question.
+
+        A hotel named in the question always precedes any mention in the
+        answer, so it is looked up once for the whole batch; answers are only
+        scanned for a hotel when the question names none.
+
+        Args:
+            question: User's question (used to identify hotel)
+            answers: Generated answers containing price information
+
+        Returns:
+            Reward scores between 0.0 and 1.0, one per answer
+        """
+        question_hotel = self._normalize_hotel_name(question)
+        return [
+            self._reward_for_hotel(
+                question_hotel if question_hotel is not None else self._normalize_hotel_name(answer),
+                answer,
+            )
+            for answer in answers
+        ]
+
+    def _reward_for_hotel(self, hotel_key: Optional[str], answer: str) -> float:
+        """Score ``answer`` against the ground truth of ``hotel_key`` (0.0 when unknown)."""
         if hotel_key is None:
             logger.debug("No hotel identified in question/answer")
             return 0.0
@@ -79,19 +121,12 @@ class PricingRewardAdapter(RewardPort):
         Returns:
             Normalized hotel key from TAJ_PRICE_TRUTH, or None if not found
         """
-        text_lower = text.lower()
-
-        # Try aliases first (more specific)
-        for alias, canonical in self.hotel_aliases.items():
-            if alias in text_lower:
-                return canonical
-
-        # Try exact keys
-        for key in self.price_truth.keys():
-            if key in text_lower:
-                return key
-
-        return None
+        # Earliest mention wins; at the same position the longer (more
+        # specific) alias wins over the bare hotel key.
+        match = self._hotel_pattern.search(text.lower())
+        if match is None:
+            return None
+        return self._hotel_lookup[match.group(0)]
 
     def _extract_price_range(self, answer: str) -> Optional[Tuple[int, int]]:
         """
@@ -108,23 +143,11 @@ class PricingRewardAdapter(RewardPort):
         Returns:
             Tuple of (min_price, max_price) or None if not found
         """
-        # Pattern to match Indian currency numbers
-        # Handles: ₹24,000 or 24000 or Rs 24,000
-        nums = re.findall(r'[₹Rs.\s]*([\d,]+)', answer)
-
-        if len(nums) < 2:
-            return None
-
-        # Parse numbers (remove commas)
-        vals = []
-        for n in nums:
-            try:
-                val = int(n.replace(",", ""))
-                # Filter reasonable hotel prices (1000 to 500000)
-                if 1000 <= val <= 500000:
-                    vals.append(val)
-            except ValueError:
-                continue
+        vals = [
+            val
+            for val in (int(n.replace(",", "")) for n in _PRICE_NUMBER_RE.findall(answer))
+            if _MIN_PRICE <= val <= _MAX_PRICE
+        ]
 
         if len(vals) < 2:
             return None
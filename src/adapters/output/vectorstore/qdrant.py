@@ -1,10 +1,35 @@
 """Qdrant Vector Store Adapter - Vector database for similarity search."""
 
-from typing import Iterable, List
+import itertools
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional
 
 from langchain_community.vectorstores import Qdrant
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client.http.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    OptimizersConfigDiff,
+    PayloadSchemaType,
+    PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
+
+try:
+    from langchain.schema import Document
+except ImportError:
+    from langchain_core.documents import Document
 
 from src.config import settings
 from src.logging import get_logger
@@ -12,28 +37,102 @@ from src.ports.output import EmbeddingsPort, VectorStorePort
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency handling
+    orjson = None
 
-def _create_client() -> QdrantClient:
-    """Create Qdrant client (cloud or local based on configuration)."""
-    if settings.qdrant.is_cloud:
-        logger.info(
-            "Initializing Qdrant cloud client for collection=%s",
-            settings.qdrant.collection_name
-        )
+# Payload flag marking points whose text is non-blank (filterable server-side)
+HAS_CONTENT_KEY = "has_content"
+
+# Drop points flagged as blank at ingest inside Qdrant. must_not (rather than
+# must has_content=True) keeps points ingested before the flag existed.
+_SKIP_EMPTY_FILTER = Filter(
+    must_not=[FieldCondition(key=HAS_CONTENT_KEY, match=MatchValue(value=False))]
+)
+
+# Payload keys that may hold the chunk text; everything else becomes metadata
+_TEXT_PAYLOAD_KEYS = frozenset({"page_content", "text", "content"})
+
+# Qdrant's default indexing_threshold, restored if the current value is unknown
+_DEFAULT_INDEXING_THRESHOLD = 20000
+
+# (client id, collection, dimension) combinations already checked this process
+_verified_collections: set[tuple[int, str, int]] = set()
+
+
+def _use_orjson_for_rest() -> None:
+    """
+    Encode Qdrant REST request bodies with orjson instead of stdlib json.
+
+    Upserts carry thousands of floats per point; orjson encodes them several
+    times faster (and numpy arrays natively). Applies to the HTTP transport
+    only - gRPC requests are protobuf-encoded. Installed once per process.
+    """
+    if orjson is None:
+        return
+    from qdrant_client.http.api_client import ApiClient
+
+    request = ApiClient.request
+    if getattr(request, "_uses_orjson", False):
+        return
+
+    def orjson_request(self, *args, **kwargs):
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["content"] = orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY)
+            headers = dict(kwargs.get("headers") or {})
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
+        return request(self, *args, **kwargs)
+
+    orjson_request._uses_orjson = True  # type: ignore[attr-defined]
+    ApiClient.request = orjson_request  # type: ignore[method-assign]
+    logger.info("Using orjson for Qdrant REST request bodies")
+
+
+@lru_cache(maxsize=4)
+def _get_client(
+    url: str | None,
+    api_key: str | None,
+    host: str,
+    port: int,
+    grpc_port: int,
+    prefer_grpc: bool,
+    is_cloud: bool,
+) -> QdrantClient:
+    """Create a Qdrant client, reused for identical connection parameters."""
+    _use_orjson_for_rest()
+    if is_cloud:
+        logger.info("Initializing Qdrant cloud client (grpc=%s)", prefer_grpc)
         return QdrantClient(
-            url=settings.qdrant.url,
-            api_key=settings.qdrant.api_key,
-            prefer_grpc=False,
+            url=url,
+            api_key=api_key,
+            https=True,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
         )
 
-    logger.info(
-        "Initializing Qdrant local client for collection=%s",
-        settings.qdrant.collection_name
-    )
+    logger.info("Initializing Qdrant local client at %s:%s (grpc=%s)", host, port, prefer_grpc)
     return QdrantClient(
-        host=settings.qdrant.host,
-        port=settings.qdrant.port,
-        prefer_grpc=False,
+        host=host,
+        port=port,
+        grpc_port=grpc_port,
+        prefer_grpc=prefer_grpc,
+    )
+
+
+def _create_client() -> QdrantClient:
+    """Return the shared Qdrant client (cloud or local based on configuration)."""
+    qdrant = settings.qdrant
+    return _get_client(
+        qdrant.url,
+        qdrant.api_key,
+        qdrant.host,
+        qdrant.port,
+        qdrant.grpc_port,
+        qdrant.prefer_grpc,
+        qdrant.is_cloud,
     )
 
 
@@ -50,14 +149,39 @@ def _extract_vector_size(collection_info) -> int | None:
     return None
 
 
+def _quantization_config() -> ScalarQuantization | None:
+    """
+    Build the collection quantization config from QDRANT_QUANTIZATION.
+
+    int8 scalar quantization keeps a 4x smaller copy of every vector in RAM
+    for scoring, while the original float32 vectors stay on disk.
+    """
+    mode = settings.qdrant.quantization.lower()
+    if mode == "int8":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+        )
+    if mode != "none":
+        logger.warning("Unknown QDRANT_QUANTIZATION=%s; use 'int8' or 'none'", mode)
+    return None
+
+
 def _ensure_collection(client: QdrantClient, collection: str) -> None:
     """
     Ensure collection exists with expected vector dimension.
 
     Recreates collection if dimension mismatch detected (prevents errors
     when switching between different embedding models).
+
+    New collections use dot-product distance: embedding adapters emit unit
+    vectors, so dot equals cosine without a per-candidate norm at search time.
+    Existing cosine collections keep working unchanged.
     """
     expected_dim = settings.embedding.dimension
+    verified_key = (id(client), collection, expected_dim)
+    if verified_key in _verified_collections:
+        return
+
     try:
         info = client.get_collection(collection)
         actual_dim = _extract_vector_size(info)
@@ -70,16 +194,84 @@ def _ensure_collection(client: QdrantClient, collection: str) -> None:
                 actual_dim,
             )
             raise ValueError("dimension_mismatch")
-        return
     except Exception:
-        logger.info("Creating (or recreating) collection %s with dim=%s", collection, expected_dim)
+        logger.info(
+            "Creating (or recreating) collection %s with dim=%s, quantization=%s",
+            collection,
+            expected_dim,
+            settings.qdrant.quantization,
+        )
+        quantization = _quantization_config()
         client.recreate_collection(
             collection_name=collection,
             vectors_config=VectorParams(
                 size=expected_dim,
-                distance=Distance.COSINE,
+                distance=Distance.DOT,
+                # Quantized collections score on the in-RAM int8 copy and only
+                # read the originals for rescoring, so those can live on disk
+                on_disk=quantization is not None,
             ),
+            quantization_config=quantization,
+        )
+    try:
+        # Backs the server-side "skip empty chunks" filter used at query time
+        client.create_payload_index(
+            collection_name=collection,
+            field_name=HAS_CONTENT_KEY,
+            field_schema=PayloadSchemaType.BOOL,
+        )
+    except Exception as exc:
+        logger.debug("Payload index on %s not created: %s", HAS_CONTENT_KEY, exc)
+    _verified_collections.add(verified_key)
+
+
+def _search_params() -> SearchParams:
+    """
+    Build query-time search params from settings.
+
+    With quantization enabled, candidates are scored on the int8 codes,
+    over-fetched by QDRANT_OVERSAMPLING, then rescored with the original
+    vectors so recall stays close to full precision.
+    """
+    quantization = None
+    if settings.qdrant.quantization.lower() != "none":
+        quantization = QuantizationSearchParams(
+            ignore=False,
+            rescore=True,
+            oversampling=settings.qdrant.oversampling,
         )
+    return SearchParams(hnsw_ef=settings.qdrant.hnsw_ef, quantization=quantization)
+
+
+def _points_to_docs(points) -> List[Document]:
+    """
+    Convert Qdrant scored points to Documents, skipping empty payloads.
+
+    Blank chunks are normally filtered out by Qdrant already; the text
+    check still covers points stored without the has_content flag.
+    """
+    # Hot loop for large top_k: bind lookups locally once
+    make_doc = Document
+    text_keys = _TEXT_PAYLOAD_KEYS
+    docs = []
+    append = docs.append
+    for pt in points:
+        payload = getattr(pt, "payload", None) or {}
+        get = payload.get
+        text = get("page_content") or get("text") or get("content") or ""
+        if not text.strip():
+            continue
+        meta = {k: v for k, v in payload.items() if k not in text_keys}
+        point_id = getattr(pt, "id", None)
+        if point_id is not None:
+            meta.setdefault("id", point_id)
+        append(make_doc(page_content=text, metadata=meta))
+
+    skipped = len(points) - len(docs)
+    if skipped:
+        logger.warning("Skipped %d points with empty text content", skipped)
+    logger.info("Converted %d points to %d Document objects", len(points), len(docs))
+    return docs
 
 
 class QdrantAdapter(VectorStorePort):
@@ -107,6 +299,9 @@ class QdrantAdapter(VectorStorePort):
 
         # Expose client for direct access (retrieval fallback)
         self.client = client
+        self.collection_name = collection
+        self.embeddings = embeddings
+        self.search_params = _search_params()
 
         # Provide search method fallback for clients missing it
         if not hasattr(client, "search"):
@@ -148,13 +343,147 @@ class QdrantAdapter(VectorStorePort):
             embeddings=embeddings,
         )
 
-    def add_documents(self, documents: Iterable) -> List[str]:
-        """Add documents to the vector store."""
-        docs = list(documents)
-        logger.info("Adding %d documents to vector store", len(docs))
-        return self.store.add_documents(docs)
+    def add_documents(self, documents: Iterable, batch_size: int = 64) -> List[str]:
+        """
+        Add documents to the vector store in batches.
+
+        Embedding of batch i+1 runs on the calling thread while batch i is
+        upserted in the background, so model and network time overlap.
+        ``documents`` is consumed lazily, so a generator (e.g. a PDF being
+        parsed page by page) gets its first batch embedded before the rest
+        has been produced.
+        """
+        docs = iter(documents)
+
+        ids: List[str] = []
+        with ThreadPoolExecutor(max_workers=1) as upload_pool:
+            pending = None
+            while batch := list(itertools.islice(docs, batch_size)):
+                points = self._build_points(batch)
+                if pending is not None:
+                    pending.result()
+                pending = upload_pool.submit(
+                    self.client.upsert,
+                    collection_name=self.collection_name,
+                    points=points,
+                )
+                ids.extend(point.id for point in points)
+            if pending is not None:
+                pending.result()
+        logger.info("Added %d documents to vector store (batch_size=%d)", len(ids), batch_size)
+        return ids
+
+    @contextmanager
+    def paused_indexing(self) -> Iterator[None]:
+        """
+        Suspend HNSW indexing for a bulk upload, then restore it.
+
+        With indexing_threshold=0 Qdrant only appends vectors while the block
+        runs; restoring the threshold afterwards builds the index once instead
+        of after every upserted batch.
+        """
+        try:
+            info = self.client.get_collection(self.collection_name)
+            threshold = info.config.optimizer_config.indexing_threshold
+            self.client.update_collection(
+                collection_name=self.collection_name,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+            )
+        except Exception as exc:
+            logger.warning("Could not pause indexing for %s: %s", self.collection_name, exc)
+            yield
+            return
+
+        logger.info("Paused indexing for %s (threshold was %s)", self.collection_name, threshold)
+        try:
+            yield
+        finally:
+            restored = threshold if threshold is not None else _DEFAULT_INDEXING_THRESHOLD
+            self.client.update_collection(
+                collection_name=self.collection_name,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=restored),
+            )
+            logger.info("Resumed indexing for %s (threshold=%s)", self.collection_name, restored)
+
+    def add_documents_with_vectors(self, documents: List, vectors, batch_size: int = 256) -> List[str]:
+        """
+        Add documents whose embeddings were already computed by the caller.
+
+        Args:
+            documents: Documents to store
+            vectors: One embedding per document (rows of an array or lists)
+            batch_size: Points per upsert request
+
+        Returns:
+            List of point IDs
+        """
+        logger.info("Adding %d pre-embedded documents to vector store", len(documents))
+        ids: List[str] = []
+        for start in range(0, len(documents), batch_size):
+            points = self._points_from_vectors(
+                documents[start:start + batch_size], vectors[start:start + batch_size]
+            )
+            self.client.upsert(collection_name=self.collection_name, points=points)
+            ids.extend(point.id for point in points)
+        return ids
+
+    def _build_points(self, docs: List) -> List[PointStruct]:
+        """Embed a batch of documents into points using the LangChain payload layout."""
+        vectors = self.embeddings.embed_documents([doc.page_content for doc in docs])
+        return self._points_from_vectors(docs, vectors)
+
+    def _points_from_vectors(self, docs: List, vectors) -> List[PointStruct]:
+        """Build points from documents and their embeddings using the LangChain payload layout."""
+        return [
+            PointStruct(
+                id=uuid.uuid4().hex,
+                vector=vector.tolist() if hasattr(vector, "tolist") else list(vector),
+                payload={
+                    self.store.content_payload_key: doc.page_content,
+                    self.store.metadata_payload_key: doc.metadata,
+                    HAS_CONTENT_KEY: bool(doc.page_content.strip()),
+                },
+            )
+            for doc, vector in zip(docs, vectors)
+        ]
+
+    def search_batch(self, query_vectors, top_k: int, hnsw_ef: Optional[int] = None) -> List[List[Document]]:
+        """
+        Search for several query vectors in one query_batch_points call.
+
+        Blank chunks are filtered out server-side, and quantized collections
+        keep their rescoring/oversampling settings.
+
+        Args:
+            query_vectors: One embedding per query (rows of an array or lists)
+            top_k: Results per query
+            hnsw_ef: HNSW beam width for these queries (defaults to QDRANT_HNSW_EF)
+
+        Returns:
+            One list of Documents per query vector, in input order
+        """
+        params = SearchParams(
+            hnsw_ef=hnsw_ef or self.search_params.hnsw_ef,
+            quantization=self.search_params.quantization,
+        )
+        requests = [
+            QueryRequest(
+                query=vector.tolist() if hasattr(vector, "tolist") else list(vector),
+                limit=top_k,
+                params=params,
+                filter=_SKIP_EMPTY_FILTER,
+                with_payload=True,
+                with_vector=False,
+            )
+            for vector in query_vectors
+        ]
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=requests,
+        )
+        return [_points_to_docs(resp.points or []) for resp in responses]
 
     def as_retriever(self, k: int):
         """Create a retriever for similarity search."""
-        logger.info("Creating retriever with top_k=%d", k)
-        return self.store.as_retriever(search_kwargs={"k": k})
+        logger.info("Creating retriever with top_k=%d, hnsw_ef=%d", k, self.search_params.hnsw_ef)
+        return self.store.as_retriever(search_kwargs={"k": k, "search_params": self.search_params})
@@ -1,6 +1,10 @@
 """RAGAS Verification Adapter - RAG evaluation using RAGAS framework."""
 
-from typing import Dict, List
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from src.config import settings
 from src.logging import get_logger
@@ -8,22 +12,53 @@ from src.ports.output import VerificationPort
 
 logger = get_logger(__name__)
 
-try:
-    from ragas import evaluate
-    from ragas.metrics import answer_relevancy, faithfulness
-    from datasets import Dataset
-    from langchain_ollama import ChatOllama
-    from langchain_openai import ChatOpenAI
-    RAGAS_AVAILABLE = True
-except Exception as e:  # pragma: no cover - optional dependency handling
-    logger.warning("RAGAS dependencies not available: %s", e)
-    evaluate = None  # type: ignore
-    answer_relevancy = None  # type: ignore
-    faithfulness = None  # type: ignore
-    Dataset = None  # type: ignore
-    ChatOllama = None  # type: ignore
-    ChatOpenAI = None  # type: ignore
-    RAGAS_AVAILABLE = False
+# RAGAS and its datasets dependency are heavy to import and unused by the
+# default heuristic backend, so they are loaded on first non-heuristic verify.
+evaluate = None  # type: ignore
+answer_relevancy = None  # type: ignore
+faithfulness = None  # type: ignore
+Dataset = None  # type: ignore
+RunConfig = None  # type: ignore
+RAGAS_AVAILABLE: Optional[bool] = None
+
+
+def _load_ragas() -> bool:
+    """Import RAGAS dependencies on first use; returns whether they are available."""
+    global evaluate, answer_relevancy, faithfulness, Dataset, RunConfig, RAGAS_AVAILABLE
+    if RAGAS_AVAILABLE is not None:
+        return RAGAS_AVAILABLE
+    try:
+        from ragas import evaluate
+        from ragas.metrics import answer_relevancy, faithfulness
+        from datasets import Dataset
+        RAGAS_AVAILABLE = True
+    except Exception as e:  # pragma: no cover - optional dependency handling
+        logger.warning("RAGAS dependencies not available: %s", e)
+        RAGAS_AVAILABLE = False
+        return RAGAS_AVAILABLE
+    try:
+        from ragas.run_config import RunConfig
+    except Exception:  # pragma: no cover - older ragas releases
+        RunConfig = None
+    return RAGAS_AVAILABLE
+
+
+# Concurrent judge requests per RAGAS evaluate() call
+_RAGAS_MAX_WORKERS = 8
+
+# Non-answers that should not count as substantial
+_DONT_KNOW_RE = re.compile(r"don'?t know|no information|not (?:sure|certain)", re.IGNORECASE)
+
+
+def _token_hashes(text: str) -> np.ndarray:
+    """Return the sorted, unique 64-bit hashes of the whitespace tokens in ``text``."""
+    return np.unique(np.fromiter((hash(word) for word in text.split()), dtype=np.int64))
+
+
+@lru_cache(maxsize=32)
+def _context_hashes(joined_contexts: str) -> np.ndarray:
+    """Hash joined, lowercased contexts once per distinct corpus."""
+    return _token_hashes(joined_contexts)
 
 
 class RagasAdapter(VerificationPort):
@@ -42,7 +77,20 @@ class RagasAdapter(VerificationPort):
     Configure via RAGAS_LLM_BACKEND environment variable.
     """
 
-    def verify(self, question: str, answer: str, contexts: List[str]) -> Dict:
+    def __init__(self):
+        self._llm_cache: Dict[str, object] = {}
+
+    def reset_llm_cache(self) -> None:
+        """Drop cached RAGAS judge clients (e.g. after changing LLM settings)."""
+        self._llm_cache.clear()
+
+    def verify(
+        self,
+        question: str,
+        answer: str,
+        contexts: List[str],
+        joined_context_lower: Optional[str] = None,
+    ) -> Dict:
         """
         Verify answer quality using RAGAS or heuristic fallback.
 
@@ -50,6 +98,8 @@ class RagasAdapter(VerificationPort):
             question: The user's question
             answer: The generated answer
             contexts: List of context strings used to generate the answer
+            joined_context_lower: Optional contexts already joined and
+                lowercased by the caller; spares the heuristic path a rebuild
 
         Returns:
             Dictionary with:
@@ -59,46 +109,88 @@ class RagasAdapter(VerificationPort):
             - confidence: "high" or "low"
             - issues: List of identified issues
         """
+        return self.verify_batch([(question, answer, contexts)], [joined_context_lower])[0]
+
+    def verify_batch(
+        self,
+        items: Sequence[Tuple[str, str, List[str]]],
+        joined_contexts_lower: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[Dict]:
+        """
+        Verify several (question, answer, contexts) triples in one RAGAS run.
+
+        A single evaluate() call lets RAGAS issue the judge requests for all
+        rows concurrently instead of paying one round-trip setup per answer.
+
+        Args:
+            items: Sequence of (question, answer, contexts) triples
+            joined_contexts_lower: Optional per-item pre-joined, lowercased
+                contexts (see verify())
+
+        Returns:
+            One verification dictionary per item, in input order (same shape
+            as verify()).
+        """
+        if not items:
+            return []
+
         backend = settings.verification.ragas_llm_backend.lower()
 
         # If heuristic mode, skip RAGAS entirely
         if backend == "heuristic":
             logger.info("Using heuristic verification (RAGAS_LLM_BACKEND=heuristic)")
-            faith, relevancy = self._heuristic_verification(answer, contexts)
-        elif RAGAS_AVAILABLE and evaluate and Dataset:
+            scores = self._heuristic_batch(items, joined_contexts_lower)
+        elif _load_ragas():
             try:
                 # Create LLM based on configuration
                 llm = self._create_ragas_llm(backend)
-                logger.info("Running RAGAS verification with %s", backend)
+                logger.info("Running RAGAS verification with %s (%d rows)", backend, len(items))
 
                 data = {
-                    "question": [question],
-                    "answer": [answer],
-                    "contexts": [contexts],
+                    "question": [question for question, _, _ in items],
+                    "answer": [answer for _, answer, _ in items],
+                    "contexts": [contexts for _, _, contexts in items],
                 }
                 dataset = Dataset.from_dict(data)
 
                 # Run RAGAS with configured LLM
+                kwargs = {}
+                if RunConfig is not None:
+                    kwargs["run_config"] = RunConfig(max_workers=_RAGAS_MAX_WORKERS)
                 results = evaluate(
                     dataset,
                     metrics=[faithfulness, answer_relevancy],
-                    llm=llm
+                    llm=llm,
+                    **kwargs,
                 )
 
-                scores = results.to_pandas().iloc[0]
-                faith = float(scores.get("faithfulness", 0.0))
-                relevancy = float(scores.get("answer_relevancy", 0.0))
-
-                logger.info("RAGAS scores: faithfulness=%.3f, relevancy=%.3f", faith, relevancy)
+                scores = [
+                    (float(row.get("faithfulness", 0.0)), float(row.get("answer_relevancy", 0.0)))
+                    for row in self._score_rows(results)
+                ]
+                for faith, relevancy in scores:
+                    logger.info("RAGAS scores: faithfulness=%.3f, relevancy=%.3f", faith, relevancy)
 
             except Exception as e:
                 logger.warning("RAGAS evaluation failed: %s, using heuristic fallback", e)
                 # Fall back to heuristic
-                faith, relevancy = self._heuristic_verification(answer, contexts)
+                scores = self._heuristic_batch(items, joined_contexts_lower)
         else:
             logger.info("RAGAS not available, using heuristic verification")
-            faith, relevancy = self._heuristic_verification(answer, contexts)
+            scores = self._heuristic_batch(items, joined_contexts_lower)
+
+        return [self._build_result(faith, relevancy) for faith, relevancy in scores]
 
+    def _score_rows(self, results) -> List[Dict]:
+        """Per-row metric scores from a RAGAS EvaluationResult without building a DataFrame."""
+        try:
+            # ragas exposes per-row scores as a list of dicts (or a row-iterable Dataset)
+            return [dict(row) for row in results.scores]
+        except Exception:
+            return results.to_pandas().to_dict("records")
+
+    def _build_result(self, faith: float, relevancy: float) -> Dict:
+        """Combine metric scores into the verification result dictionary."""
         overall = (faith + relevancy) / 2 if (faith or relevancy) else 0.0
         confidence = (
             "high"
@@ -115,17 +207,30 @@ class RagasAdapter(VerificationPort):
         }
 
     def _create_ragas_llm(self, backend: str):
+        """Return the RAGAS judge LLM for ``backend``, creating it on first use."""
+        if backend not in self._llm_cache:
+            self._llm_cache[backend] = self._build_ragas_llm(backend)
+        return self._llm_cache[backend]
+
+    def _build_ragas_llm(self, backend: str):
         """Create LLM for RAGAS evaluation based on backend configuration."""
         if backend == "openai":
             if not settings.llm.openai.api_key:
                 raise ValueError("RAGAS_LLM_BACKEND=openai but OPENAI_API_KEY not set")
+            from langchain_openai import ChatOpenAI
+
+            from src.adapters.output.llm.http import shared_http_client
+
             logger.info("Creating OpenAI LLM for RAGAS: %s", settings.llm.openai.model)
             return ChatOpenAI(
                 model=settings.llm.openai.model,
                 api_key=settings.llm.openai.api_key,
-                temperature=0
+                temperature=0,
+                http_client=shared_http_client(),
             )
         elif backend == "ollama":
+            from langchain_ollama import ChatOllama
+
             logger.info("Creating Ollama LLM for RAGAS: %s", settings.llm.ollama.model)
             return ChatOllama(
                 base_url=settings.llm.ollama.base_url,
@@ -138,27 +243,42 @@ class RagasAdapter(VerificationPort):
                 f"Use 'ollama', 'openai', or 'heuristic'"
             )
 
-    def _heuristic_verification(self, answer: str, contexts: List[str]) -> tuple[float, float]:
+    def _heuristic_batch(
+        self,
+        items: Sequence[Tuple[str, str, List[str]]],
+        joined_contexts_lower: Optional[Sequence[Optional[str]]],
+    ) -> List[Tuple[float, float]]:
+        """Heuristic scores for each item, reusing caller-joined contexts when given."""
+        joined = joined_contexts_lower or [None] * len(items)
+        return [
+            self._heuristic_verification(answer, contexts, joined_lower)
+            for (_, answer, contexts), joined_lower in zip(items, joined)
+        ]
+
+    def _heuristic_verification(
+        self, answer: str, contexts: List[str], joined_context_lower: Optional[str] = None
+    ) -> tuple[float, float]:
         """
         Simple heuristic verification when RAGAS is unavailable.
 
         Uses basic text analysis:
         - Faithfulness: Based on word overlap between answer and context
-        - Relevancy: Based on answer length and "don't know" detection
+        - Relevancy: Based on answer length and "don't know"/no-information detection
 
         Fast and free, but less accurate than RAGAS with LLM.
         """
         # Check if answer is substantial
+        has_substantial_answer = len(answer) > 20 and _DONT_KNOW_RE.search(answer) is None
         answer_lower = answer.lower()
-        has_substantial_answer = len(answer) > 20 and "don't know" not in answer_lower
 
         # Check context overlap
-        context_text = " ".join(contexts).lower()
-        answer_words = set(answer_lower.split())
-        context_words = set(context_text.split())
+        if joined_context_lower is None:
+            joined_context_lower = " ".join(contexts).lower()
+        context_hashes = _context_hashes(joined_context_lower)
+        answer_hashes = _token_hashes(answer_lower)
 
-        if answer_words:
-            overlap_ratio = len(answer_words & context_words) / len(answer_words)
+        if answer_hashes.size:
+            overlap_ratio = float(np.isin(answer_hashes, context_hashes, assume_unique=True).mean())
         else:
             overlap_ratio = 0.0
 
@@ -8,14 +8,56 @@ Analyzes training data to provide insights on:
 - Quality metrics
 """
 
-import json
-from datetime import datetime
+import mmap
+import os
+import re
+import threading
+from datetime import date
 from pathlib import Path
 from typing import Dict, List, Tuple
 from collections import defaultdict
 
+import numpy as np
+import orjson
 import pandas as pd
 
+# ISO-8601 timestamps start with the calendar date; that prefix is the group key
+_ISO_DATE_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse_jsonl(log_file: Path, offset: int = 0, size: int | None = None) -> Tuple[List[Dict], int]:
+    """
+    Parse complete JSONL lines from a read-only memory map, starting at offset.
+
+    Lines are parsed as bytes (no text decoding). A trailing line without a
+    newline that does not parse may still be mid-write, so it is left for the
+    next call.
+
+    Args:
+        log_file: JSONL file to read
+        offset: Byte offset to resume from
+        size: File size if the caller already has it (skips a stat call)
+
+    Returns:
+        (records, offset just past the last complete line)
+    """
+    records: List[Dict] = []
+    if size is None:
+        size = log_file.stat().st_size
+    with open(log_file, "rb") as f:
+        if size <= offset:
+            return records, offset  # nothing new (mmap cannot map an empty file)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mm.seek(offset)
+            for line in iter(mm.readline, b""):
+                try:
+                    records.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    if not line.endswith(b"\n"):
+                        break
+                offset += len(line)
+    return records, offset
+
 
 class RLVRAnalytics:
     """Analyze RLVR training data and compute metrics."""
@@ -23,17 +65,65 @@ class RLVRAnalytics:
     def __init__(self, log_dir: str = "training_data"):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
+        self._cache_key: Tuple | None = None
+        self._cache: List[Dict] = []
+        # JSONL logs are append-only: remember how far each file has been parsed
+        self._offsets: Dict[Path, int] = {}
+        self._parsed: Dict[Path, List[Dict]] = {}
+        # The Streamlit apps share one instance across sessions
+        self._lock = threading.Lock()
+
+    def _scan_log_files(self) -> List[Tuple[str, int, int]]:
+        """(path, mtime_ns, size) for every log file, sorted by name, from one directory scan."""
+        with os.scandir(self.log_dir) as it:
+            entries = []
+            for entry in it:
+                if entry.name.endswith(".jsonl") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        entries.sort()
+        return entries
 
     def load_interactions(self) -> List[Dict]:
-        """Load all training interactions from JSONL files."""
+        """
+        Load all training interactions from JSONL files.
+
+        Results are cached until a log file is added, removed, or modified, so
+        the several metrics computed for one page render parse the logs once.
+        When a log grows, only the newly appended lines are parsed; a file that
+        shrank (rotated or rewritten) is re-read from the start.
+        The returned list is shared - treat it as read-only.
+        """
+        with self._lock:
+            return self._load_interactions()
+
+    def _load_interactions(self) -> List[Dict]:
+        # The (path, mtime, size) snapshot changes on any write, add or removal
+        entries = self._scan_log_files()
+        key = tuple(entries)
+        if key == self._cache_key:
+            return self._cache
+
         interactions = []
-        for log_file in self.log_dir.glob("*.jsonl"):
-            with open(log_file, encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        interactions.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        seen = set()
+        for path, _, size in entries:
+            log_file = Path(path)
+            seen.add(log_file)
+            offset = self._offsets.get(log_file, 0)
+            if size < offset:
+                offset = 0
+                self._parsed.pop(log_file, None)
+            records, self._offsets[log_file] = _parse_jsonl(log_file, offset, size)
+            parsed = self._parsed.setdefault(log_file, [])
+            parsed.extend(records)
+            interactions.extend(parsed)
+
+        for removed in set(self._parsed) - seen:
+            self._parsed.pop(removed, None)
+            self._offsets.pop(removed, None)
+
+        self._cache_key = key
+        self._cache = interactions
         return interactions
 
     def get_basic_stats(self) -> Dict:
@@ -51,13 +141,17 @@ class RLVRAnalytics:
                 "target_interactions": 500,
             }
 
-        scores = [i["verification"]["overall_score"] for i in interactions]
-        avg_score = sum(scores) / len(scores) if scores else 0.0
+        scores = np.fromiter(
+            (i["verification"]["overall_score"] for i in interactions),
+            dtype=np.float64,
+            count=len(interactions),
+        )
+        avg_score = float(scores.mean())
 
         # Quality thresholds
-        high_quality = sum(1 for s in scores if s >= 0.8)
-        medium_quality = sum(1 for s in scores if 0.5 <= s < 0.8)
-        low_quality = sum(1 for s in scores if s < 0.5)
+        high_quality = int((scores >= 0.8).sum())
+        medium_quality = int(((scores >= 0.5) & (scores < 0.8)).sum())
+        low_quality = int((scores < 0.5).sum())
 
         target = 500
         progress = min(100.0, (len(interactions) / target) * 100)
@@ -68,9 +162,9 @@ class RLVRAnalytics:
             "high_quality_count": high_quality,
             "medium_quality_count": medium_quality,
             "low_quality_count": low_quality,
-            "high_quality_percentage": (high_quality / len(scores) * 100) if scores else 0,
-            "medium_quality_percentage": (medium_quality / len(scores) * 100) if scores else 0,
-            "low_quality_percentage": (low_quality / len(scores) * 100) if scores else 0,
+            "high_quality_percentage": high_quality / len(scores) * 100,
+            "medium_quality_percentage": medium_quality / len(scores) * 100,
+            "low_quality_percentage": low_quality / len(scores) * 100,
             "progress_percentage": progress,
             "target_interactions": target,
             "remaining_interactions": max(0, target - len(interactions)),
@@ -97,31 +191,31 @@ class RLVRAnalytics:
         if not interactions:
             return pd.DataFrame(columns=["date", "score", "count"])
 
-        # Parse timestamps and group by date
-        data = []
+        # Group by the timestamp's date prefix in a single pass (no datetime parsing)
+        score_sums: Dict[str, float] = defaultdict(float)
+        counts: Dict[str, int] = defaultdict(int)
         for interaction in interactions:
-            timestamp = interaction.get("timestamp", "")
+            match = _ISO_DATE_PREFIX.match(interaction.get("timestamp", ""))
+            if match is None:
+                continue
             try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                date = dt.date()
                 score = interaction["verification"]["overall_score"]
-                data.append({"date": date, "score": score})
-            except (ValueError, KeyError):
+            except KeyError:
                 continue
+            day = match.group(0)
+            score_sums[day] += score
+            counts[day] += 1
 
-        if not data:
+        if not counts:
             return pd.DataFrame(columns=["date", "score", "count"])
 
-        df = pd.DataFrame(data)
-
-        # Group by date
-        daily_stats = df.groupby("date").agg({
-            "score": ["mean", "count"]
-        }).reset_index()
-
-        daily_stats.columns = ["date", "avg_score", "count"]
-
-        return daily_stats
+        # Only the small per-date aggregate becomes a DataFrame
+        days = sorted(counts)
+        return pd.DataFrame({
+            "date": [date.fromisoformat(day) for day in days],
+            "avg_score": [score_sums[day] / counts[day] for day in days],
+            "count": [counts[day] for day in days],
+        })
 
     def get_score_trend(self) -> Tuple[List[int], List[float]]:
         """Get score trend over interactions (moving average)."""
@@ -136,24 +230,25 @@ class RLVRAnalytics:
             key=lambda x: x.get("timestamp", "")
         )
 
-        scores = [i["verification"]["overall_score"] for i in sorted_interactions]
+        scores = np.fromiter(
+            (i["verification"]["overall_score"] for i in sorted_interactions),
+            dtype=np.float64,
+            count=len(sorted_interactions),
+        )
 
-        # Calculate moving average (window of 10)
+        # Calculate moving average (window of 10) from prefix sums in O(N)
         window = 10
-        moving_avg = []
-        indices = []
-
-        for i in range(len(scores)):
-            if i < window:
-                # Use all available data points
-                avg = sum(scores[:i+1]) / (i+1)
-            else:
-                # Use window
-                avg = sum(scores[i-window+1:i+1]) / window
-            moving_avg.append(avg)
-            indices.append(i + 1)
-
-        return indices, moving_avg
+        cumsum = np.cumsum(scores)
+        moving_avg = np.empty_like(cumsum)
+
+        # First points: use all available data points
+        head = min(window, len(scores))
+        moving_avg[:head] = cumsum[:head] / np.arange(1, head + 1)
+        # Afterwards: sum of the last `window` scores
+        moving_avg[window:] = (cumsum[window:] - cumsum[:-window]) / window
+
+        indices = list(range(1, len(scores) + 1))
+        return indices, moving_avg.tolist()
 
     def get_quality_breakdown(self) -> Dict[str, int]:
         """Get breakdown of answer quality."""
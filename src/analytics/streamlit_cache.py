@@ -0,0 +1,62 @@
+"""
+Streamlit caching for the RLVR analytics dashboards.
+
+Both Streamlit apps share one RLVRAnalytics per log directory, so its
+incremental per-file offsets and parsed records survive reruns and sessions
+instead of being rebuilt (and every log re-parsed) on each cache miss.
+"""
+
+from pathlib import Path
+from typing import Tuple
+
+import streamlit as st
+
+from .metrics import RLVRAnalytics
+
+
+@st.cache_resource(show_spinner=False)
+def shared_analytics(log_dir: str = "training_data") -> RLVRAnalytics:
+    """Process-wide RLVRAnalytics for ``log_dir``."""
+    return RLVRAnalytics(log_dir)
+
+
+def _training_data_key(log_dir: str) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Sorted (name, size, mtime_ns) of every training log.
+
+    Unlike the latest mtime alone, this also changes when a file is
+    deleted, replaced by an older copy, or appended within the same tick.
+    """
+    files = []
+    for path in Path(log_dir).glob("*.jsonl"):
+        stat = path.stat()
+        files.append((path.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(files))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _basic_stats(log_dir: str, files: Tuple[Tuple[str, int, int], ...]) -> dict:
+    return shared_analytics(log_dir).get_basic_stats()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _rl_readiness(log_dir: str, files: Tuple[Tuple[str, int, int], ...]) -> dict:
+    return shared_analytics(log_dir).estimate_rl_readiness()
+
+
+def cached_basic_stats(analytics: RLVRAnalytics) -> dict:
+    """Basic stats, recomputed only when the training logs change."""
+    log_dir = str(analytics.log_dir)
+    return _basic_stats(log_dir, _training_data_key(log_dir))
+
+
+def cached_rl_readiness(analytics: RLVRAnalytics) -> dict:
+    """RL readiness estimate, recomputed only when the training logs change."""
+    log_dir = str(analytics.log_dir)
+    return _rl_readiness(log_dir, _training_data_key(log_dir))
+
+
+def clear_cached_analytics() -> None:
+    """Drop memoized stats so the next render recomputes them."""
+    _basic_stats.clear()
+    _rl_readiness.clear()
@@ -1,5 +1,5 @@
 """Ground Truth Data for RLVR Verification"""
 
-from .taj_hotels_pricing import TAJ_PRICE_TRUTH
+from .taj_hotels_pricing import HOTEL_NAME_TO_KEY, TAJ_PRICE_TRUTH
 
-__all__ = ["TAJ_PRICE_TRUTH"]
+__all__ = ["HOTEL_NAME_TO_KEY", "TAJ_PRICE_TRUTH"]
@@ -28,3 +28,9 @@ TAJ_HOTEL_ALIASES = {
     "taj bengal kolkata": "taj bengal",
     "taj coromandel chennai": "taj coromandel",
 }
+
+# Lowercased canonical keys and aliases -> canonical TAJ_PRICE_TRUTH key,
+# merged once at import so lookups are a single dict get.
+HOTEL_NAME_TO_KEY = {key.lower(): key for key in TAJ_PRICE_TRUTH}
+HOTEL_NAME_TO_KEY.update({alias.lower(): key for alias, key in TAJ_HOTEL_ALIASES.items()})
+
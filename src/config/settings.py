@@ -6,43 +6,61 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _load_streamlit_secrets() -> dict:
+    """Snapshot Streamlit secrets once; empty when Streamlit or secrets are absent."""
+    try:
+        import streamlit as st
+        return {key: st.secrets[key] for key in st.secrets}
+    except (ImportError, FileNotFoundError, KeyError, AttributeError):
+        return {}
+
+
+_STREAMLIT_SECRETS = _load_streamlit_secrets()
+
+
 # Support both .env (local) and Streamlit secrets (cloud)
 def get_env(key: str, default=None):
     """Get environment variable from .env or Streamlit secrets."""
     # Try Streamlit secrets first (for cloud deployment)
-    try:
-        import streamlit as st
-        if hasattr(st, 'secrets') and key in st.secrets:
-            return st.secrets[key]
-    except (ImportError, FileNotFoundError, KeyError, AttributeError):
-        pass
+    if key in _STREAMLIT_SECRETS:
+        return _STREAMLIT_SECRETS[key]
 
     # Fall back to os.getenv (for local .env)
     return os.getenv(key, default)
 
 
-@dataclass
+# Not frozen: the Streamlit sidebar adjusts chunking at runtime.
+@dataclass(slots=True)
 class ChunkConfig:
     size: int = int(get_env("CHUNK_SIZE", 600))
     overlap: int = int(get_env("CHUNK_OVERLAP", 80))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetrievalConfig:
     top_k: int = int(get_env("TOP_K_RESULTS", 6))
+    max_context_chars: int = int(get_env("MAX_CONTEXT_CHARS", 6000))  # 0 = no cap
+    # Seconds a cached retrieval stays valid; covers ingests by other processes (0 = no cache)
+    cache_ttl_seconds: float = float(get_env("RETRIEVAL_CACHE_TTL_SECONDS", 300))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerificationConfig:
     faithfulness_threshold: float = float(get_env("FAITHFULNESS_THRESHOLD", 0.7))
     relevancy_threshold: float = float(get_env("RELEVANCY_THRESHOLD", 0.7))
     ragas_llm_backend: str = get_env("RAGAS_LLM_BACKEND", "heuristic")  # ollama | openai | heuristic
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QdrantConfig:
     host: str = get_env("QDRANT_HOST", "localhost")
     port: int = int(get_env("QDRANT_PORT", 6333))
+    grpc_port: int = int(get_env("QDRANT_GRPC_PORT", 6334))
+    # Opt in with QDRANT_PREFER_GRPC=true once port 6334 is reachable; str() accepts TOML bools from st.secrets
+    prefer_grpc: bool = str(get_env("QDRANT_PREFER_GRPC", "false")).lower() == "true"
+    hnsw_ef: int = int(get_env("QDRANT_HNSW_EF", 128))
+    quantization: str = get_env("QDRANT_QUANTIZATION", "int8")  # int8 | none
+    oversampling: float = float(get_env("QDRANT_OVERSAMPLING", 2.0))
     collection_name: str = get_env("QDRANT_COLLECTION_NAME", "pdf_documents")
     url: str | None = get_env("QDRANT_URL") or None
     api_key: str | None = get_env("QDRANT_API_KEY") or None
@@ -63,39 +81,44 @@ class QdrantConfig:
         return "local"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OllamaConfig:
     base_url: str = get_env("OLLAMA_BASE_URL", "http://localhost:11434")
     model: str = get_env("OLLAMA_MODEL", "llama3.2:3b")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OpenAIConfig:
     api_key: str | None = get_env("OPENAI_API_KEY")
     model: str = get_env("OPENAI_MODEL", "gpt-4o-mini")
     embedding_model: str = get_env("OPENAI_EMBED_MODEL", "text-embedding-3-small")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMConfig:
     backend: str = get_env("LLM_BACKEND", "ollama")  # ollama | openai
+    cache_enabled: bool = str(get_env("LLM_CACHE_ENABLED", "false")).lower() == "true"
+    cache_path: str = get_env("LLM_CACHE_PATH", ".cache/llm_cache.sqlite3")
     ollama: OllamaConfig = field(default_factory=OllamaConfig)
     openai: OpenAIConfig = field(default_factory=OpenAIConfig)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VectorStoreConfig:
     backend: str = get_env("VECTOR_STORE_BACKEND", "qdrant")  # qdrant | pinecone (example)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddingConfig:
     backend: str = get_env("EMBEDDING_BACKEND", "sentence")  # sentence | hashing | openai
     model_name: str = get_env("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
     dimension: int = int(get_env("EMBEDDING_DIMENSION", 384))
+    num_threads: int = int(get_env("EMBEDDING_NUM_THREADS", 0))  # 0 = all cores
+    runtime: str = get_env("EMBEDDING_RUNTIME", "torch")  # torch | fp16 | bettertransformer
+    cache_dtype: str = get_env("EMBEDDING_CACHE_DTYPE", "float32")  # float32 | float16 (lossy, half memory)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     log_level: str = get_env("LOG_LEVEL", "INFO")
 
@@ -104,7 +127,7 @@ class AppConfig:
         return getattr(__import__("logging"), self.log_level.upper(), __import__("logging").INFO)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
     qdrant: QdrantConfig = field(default_factory=QdrantConfig)
     llm: LLMConfig = field(default_factory=LLMConfig)
@@ -0,0 +1,73 @@
+"""
+JSONL append writer shared by the training data loggers.
+
+Keeps one buffered append handle open instead of opening and closing the
+log file for every record.
+"""
+
+import atexit
+import threading
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import orjson
+
+
+class JSONLWriter:
+    """
+    Append lines to a JSONL file through a persistent buffered handle.
+
+    The handle follows the target path: writing to a different file (e.g. a
+    new monthly log) closes the old handle and opens the new one. Lines are
+    flushed every ``flush_every`` writes; the default of 1 keeps each record
+    visible to readers (such as the analytics dashboard) as soon as it is
+    logged, while batch jobs can raise it to cut write syscalls further.
+    """
+
+    def __init__(self, flush_every: int = 1, buffer_size: int = 1 << 16):
+        self.flush_every = max(1, flush_every)
+        self.buffer_size = buffer_size
+        self._path: Optional[Path] = None
+        self._fh: Optional[BinaryIO] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def write_line(self, path: Path, line: bytes) -> None:
+        """Append an encoded JSON ``line`` plus a newline to ``path``."""
+        with self._lock:
+            if self._fh is None or path != self._path:
+                self._close_handle()
+                self._fh = open(path, "ab", buffering=self.buffer_size)
+                self._path = path
+            self._fh.write(line + b"\n")
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._fh.flush()
+                self._pending = 0
+
+    def flush(self) -> None:
+        """Flush buffered lines to the file."""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+                self._pending = 0
+
+    def close(self) -> None:
+        """Flush and close the open handle, if any."""
+        with self._lock:
+            self._close_handle()
+
+    def _close_handle(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+        self._fh = None
+        self._path = None
+        self._pending = 0
+
+
+def write_json_atomic(path: Path, data: dict) -> None:
+    """Write ``data`` as JSON to ``path`` via a temp file and rename, so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(orjson.dumps(data))
+    tmp.replace(path)
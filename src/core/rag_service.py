@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
-from string import Template
-
-from langchain_ollama import ChatOllama
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Sequence, Tuple, Optional
 
 try:
     from langchain.schema import Document
@@ -16,18 +21,36 @@ from src.ports.output import EmbeddingsPort, LLMPort, PDFProcessorPort, Verifica
 from src.core.training_logger import TrainingDataLogger
 
 
-QA_PROMPT = Template(
+QA_PROMPT = (
     "You are a helpful assistant. Use the following context to answer the question.\n"
     "Answer based on the information provided in the context. "
     "If the exact answer is not available, provide the most relevant information from the context.\n\n"
-    "Context:\n${context}\n\n"
-    "Question: ${question}\n\n"
+    "Context:\n{context}\n\n"
+    "Question: {question}\n\n"
     "Answer:"
 )
 
 
 logger = get_logger(__name__)
 
+# Distinct (question, top_k, hnsw_ef) retrievals kept in RAGService's LRU cache
+_RETRIEVAL_CACHE_SIZE = 1024
+
+
+# Per-process PDF processor built by _init_chunk_worker in each pool process
+_worker_processor: Optional[PDFProcessorPort] = None
+
+
+def _init_chunk_worker(processor_cls: Callable[..., PDFProcessorPort], chunk_size: int, chunk_overlap: int) -> None:
+    """Build this worker process's PDF processor with the parent's chunk settings."""
+    global _worker_processor
+    _worker_processor = processor_cls(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+
+def _chunk_worker(filename: str, file_bytes: bytes) -> Tuple[str, List[Document]]:
+    """Chunk one PDF in a worker process; returns (filename, docs)."""
+    return filename, _worker_processor.chunk(file_bytes, source_name=filename)
+
 
 class RAGService:
     """Hexagonal core service wiring ports/adapters for ingestion and QA."""
@@ -43,6 +66,7 @@ class RAGService:
         enable_training_logging: bool = True,
         rlvr_candidate_service: Optional[object] = None,
         rlvr_training_logger: Optional[object] = None,
+        training_logger: Optional[TrainingDataLogger] = None,
     ):
         self.vector_store = vector_store
         self.embeddings = embeddings
@@ -50,12 +74,26 @@ class RAGService:
         self.verifier = verifier
         self.llm = llm
         self.top_k = top_k
+        self.hnsw_ef = self._default_hnsw_ef(top_k)
         self.retriever = self.vector_store.as_retriever(k=self.top_k)
-        self.training_logger = TrainingDataLogger(enabled=enable_training_logging)
+        # Share the factory's logger so sessions do not overwrite each other's totals
+        if not enable_training_logging:
+            self.training_logger = TrainingDataLogger(enabled=False)
+        else:
+            self.training_logger = training_logger or TrainingDataLogger()
 
         # RLVR components (optional)
         self.rlvr_candidate_service = rlvr_candidate_service
         self.rlvr_training_logger = rlvr_training_logger
+        # Background log writes that can overlap verification
+        self._logging_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rag-log")
+
+        # (question, top_k, hnsw_ef) -> (stored_at, ((text, metadata), ...)), least recently used first
+        self._retrieval_cache: OrderedDict[
+            Tuple[str, int, int], Tuple[float, Tuple[Tuple[str, Dict], ...]]
+        ] = OrderedDict()
+        # Streamlit serves sessions from several threads sharing this service
+        self._retrieval_cache_lock = threading.Lock()
 
         logger.info("RAGService initialized (profile=%s, top_k=%d, training_logging=%s, rlvr_enabled=%s)",
                    settings.qdrant.active_profile, self.top_k, enable_training_logging,
@@ -63,84 +101,253 @@ class RAGService:
 
     def update_top_k(self, top_k: int) -> None:
         self.top_k = top_k
+        self.hnsw_ef = self._default_hnsw_ef(top_k)
         self.retriever = self.vector_store.as_retriever(k=top_k)
-        logger.info("Updated retriever top_k to %d", top_k)
-
-    def _retrieve(self, question: str):
-        """Retrieve using direct client call to avoid search API incompatibilities."""
-        if hasattr(self.vector_store, "client"):
-            client = getattr(self.vector_store, "client")
-            query_vec = self.embeddings.embed_query(question)
-            try:
-                resp = client.query_points(
-                    collection_name=settings.qdrant.collection_name,
-                    query=query_vec,
-                    limit=self.top_k,
-                    with_payload=True,
-                    with_vectors=False,
-                )
-                # Correctly handle QueryResponse object from qdrant-client v1.16+
-                if hasattr(resp, "points"):
-                    # Modern qdrant-client: QueryResponse has .points attribute
-                    points = resp.points or []
-                    logger.debug("Using QueryResponse.points (found %d points)", len(points))
-                else:
-                    # Fallback for older versions
-                    points_raw = getattr(resp, "result", resp)
-                    if isinstance(points_raw, tuple):
-                        points = points_raw[0] or []
-                    else:
-                        points = points_raw or []
-                    logger.debug("Using fallback response handling (found %d points)", len(points))
-
-                logger.info("Retrieved %d points from Qdrant for question", len(points))
-
-                docs = []
-                for pt in points:
-                    payload = getattr(pt, "payload", {}) or {}
-                    text = payload.get("page_content") or payload.get("text") or payload.get("content") or ""
-                    if not text.strip():
-                        logger.warning("Skipping point with empty text content")
-                        continue
-                    meta = {k: v for k, v in payload.items() if k not in {"page_content", "text", "content"}}
-                    if hasattr(pt, "id"):
-                        meta.setdefault("id", getattr(pt, "id"))
-                    docs.append(Document(page_content=text, metadata=meta))
-
-                logger.info("Converted %d points to %d Document objects", len(points), len(docs))
-                return docs
-            except Exception as exc:
-                logger.error("Direct Qdrant query_points failed: %s", exc, exc_info=True)
-                return []
-        logger.warning("Vector store has no client attribute, returning empty results")
-        return []
-
-    def process_pdfs(self, uploaded_files: List[Tuple[str, bytes]]) -> int:
-        """Ingest multiple PDFs; returns count of added chunks."""
+        logger.info("Updated retriever top_k to %d (hnsw_ef=%d)", top_k, self.hnsw_ef)
+
+    @staticmethod
+    def _default_hnsw_ef(top_k: int) -> int:
+        """HNSW beam width for top_k results: the configured floor, or 4x top_k if larger."""
+        return max(settings.qdrant.hnsw_ef, 4 * top_k)
+
+    def _retrieve(self, question: str, ef_search: Optional[int] = None):
+        """Retrieve context for one question via the batched vector store search."""
+        return self._retrieve_batch([question], ef_search=ef_search)[0]
+
+    def _retrieve_batch(
+        self, questions: Sequence[str], ef_search: Optional[int] = None
+    ) -> List[List[Document]]:
+        """
+        Retrieve for several questions with one embedding pass and one vector store call.
+
+        Args:
+            questions: Questions to retrieve context for
+            ef_search: Optional HNSW beam width override (defaults to self.hnsw_ef)
+
+        Returns:
+            One list of Documents per question, in input order
+        """
+        if not questions:
+            return []
+        # Repeated questions (UI reruns, RLVR replays) skip embedding and search.
+        # Entries expire after RETRIEVAL_CACHE_TTL_SECONDS, since other processes
+        # can ingest into the collection without clearing this cache.
+        ef = ef_search or self.hnsw_ef
+        ttl = settings.retrieval.cache_ttl_seconds
+        keys = [(question, self.top_k, ef) for question in questions]
+        found: Dict[Tuple[str, int, int], Tuple[Tuple[str, Dict], ...]] = {}
+        now = time.monotonic()
+        with self._retrieval_cache_lock:
+            cache = self._retrieval_cache
+            for key in dict.fromkeys(keys):
+                entry = cache.get(key)
+                if entry is None:
+                    continue
+                if now - entry[0] >= ttl:
+                    del cache[key]
+                    continue
+                cache.move_to_end(key)
+                found[key] = entry[1]
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            fetched = self._query_batch([key[0] for key in missing], ef) or []
+            new = {
+                key: tuple((doc.page_content, doc.metadata) for doc in docs)
+                for key, docs in zip(missing, fetched)
+            }
+            found.update(new)
+            if ttl > 0 and new:
+                with self._retrieval_cache_lock:
+                    cache = self._retrieval_cache
+                    for key, entry in new.items():
+                        cache[key] = (now, entry)  # age from before the search
+                    while len(cache) > _RETRIEVAL_CACHE_SIZE:
+                        cache.popitem(last=False)
+
+        results = []
+        for key in keys:
+            entry = found.get(key)
+            if entry is None:  # query failed; not cached
+                results.append([])
+                continue
+            results.append([Document(page_content=text, metadata=dict(meta)) for text, meta in entry])
+        return results
+
+    def clear_retrieval_cache(self) -> None:
+        """Drop cached retrieval results (called after ingesting new documents)."""
+        with self._retrieval_cache_lock:
+            self._retrieval_cache.clear()
+
+    def _query_batch(self, questions: Sequence[str], ef_search: int) -> Optional[List[List[Document]]]:
+        """Embed questions and search the vector store in one batch; None if the search failed."""
+        query_vecs = self.embeddings.embed_queries(questions)
+        try:
+            results = self.vector_store.search_batch(query_vecs, top_k=self.top_k, hnsw_ef=ef_search)
+        except Exception as exc:
+            logger.error("Vector store batch search failed: %s", exc, exc_info=True)
+            return None
+
+        logger.info("Retrieved batch of %d questions from the vector store", len(questions))
+        return results
+
+    def _cap_context(self, docs: List[Document]) -> List[Document]:
+        """
+        Keep the leading (highest-ranked) docs that fit the prompt context budget.
+
+        The top document is always kept so a single oversized chunk still
+        yields an answer. A budget of 0 disables the cap.
+        """
+        budget = settings.retrieval.max_context_chars
+        if budget <= 0:
+            return docs
+        used = 0
+        for count, doc in enumerate(docs):
+            used += len(doc.page_content) + (2 if count else 0)  # "\n\n" separator
+            if used > budget and count:
+                logger.info("Context budget of %d chars reached; dropped %d of %d docs", budget, len(docs) - count, len(docs))
+                return docs[:count]
+        return docs
+
+    def process_pdfs(self, uploaded_files: List[Tuple[str, bytes]], workers: Optional[int] = None) -> int:
+        """
+        Ingest multiple PDFs; returns count of added chunks.
+
+        PDF parsing is CPU-bound and files are independent, so with several
+        files they are chunked in a process pool while the parent process
+        uploads each result as it arrives. Without the pool, each PDF's
+        chunks are streamed into the vector store so embedding starts while
+        later pages are still being parsed.
+
+        Args:
+            uploaded_files: (filename, PDF bytes) pairs
+            workers: Chunking processes (default: min(CPU count, 4)); 1 disables the pool
+        """
         chunks_added = 0
-        for filename, file_bytes in uploaded_files:
-            docs = self.pdf_processor.chunk(file_bytes, source_name=filename)
-            if not docs:
+        for filename, docs in self._chunk_pdfs(uploaded_files, workers, stream=True):
+            added = len(self.vector_store.add_documents(docs))
+            if not added:
                 logger.warning("No chunks extracted from %s; skipping", filename)
                 continue
-            self.vector_store.add_documents(docs)
-            chunks_added += len(docs)
+            chunks_added += added
+        if chunks_added:
+            self.clear_retrieval_cache()
         logger.info("Finished ingesting PDFs; total chunks added=%d", chunks_added)
         return chunks_added
 
-    def answer_question(self, question: str):
+    def process_pdfs_bulk(self, uploaded_files: List[Tuple[str, bytes]], workers: Optional[int] = None) -> int:
+        """
+        Ingest a large set of PDFs with one upload and a single index build.
+
+        All files are chunked first and embedded in a single call, then
+        uploaded together while the vector store's indexing is paused (when
+        the adapter supports it).
+
+        Args:
+            uploaded_files: (filename, PDF bytes) pairs
+            workers: Chunking processes, as for process_pdfs()
+
+        Returns:
+            Count of added chunks
+        """
+        all_docs = []
+        for filename, docs in self._chunk_pdfs(uploaded_files, workers):
+            if not docs:
+                logger.warning("No chunks extracted from %s; skipping", filename)
+                continue
+            all_docs.extend(docs)
+        if not all_docs:
+            return 0
+
+        # One embedding call for the whole run lets the model batch at full width
+        vectors = self.embeddings.embed_documents([doc.page_content for doc in all_docs])
+
+        paused_indexing = getattr(self.vector_store, "paused_indexing", None)
+        with paused_indexing() if paused_indexing else nullcontext():
+            self.vector_store.add_documents_with_vectors(all_docs, vectors)
+        self.clear_retrieval_cache()
+        logger.info("Finished bulk ingest of %d PDFs; total chunks added=%d", len(uploaded_files), len(all_docs))
+        return len(all_docs)
+
+    def _chunk_pdfs(
+        self,
+        uploaded_files: List[Tuple[str, bytes]],
+        workers: Optional[int] = None,
+        stream: bool = False,
+    ):
+        """
+        Yield (filename, docs) per PDF, in a spawned process pool when worthwhile.
+
+        Workers start from a fresh interpreter (the parent runs logging and
+        client threads, so forking it is unsafe) and build their own processor
+        from the current chunk settings. With ``stream=True`` and no pool, docs
+        is a lazy chunk iterator (when the PDF processor offers chunk_stream)
+        rather than a list.
+        """
+        if workers is None:
+            workers = min(os.cpu_count() or 1, 4)
+        workers = min(workers, len(uploaded_files))
+        if workers <= 1:
+            chunk = self.pdf_processor.chunk
+            if stream:
+                chunk = getattr(self.pdf_processor, "chunk_stream", chunk)
+            for filename, file_bytes in uploaded_files:
+                yield filename, chunk(file_bytes, source_name=filename)
+            return
+
+        logger.info("Chunking %d PDFs with %d worker processes", len(uploaded_files), workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_chunk_worker,
+            # Chunk settings may have been changed at runtime (e.g. the Streamlit sidebar)
+            initargs=(type(self.pdf_processor), settings.chunk.size, settings.chunk.overlap),
+        ) as pool:
+            futures = [
+                pool.submit(_chunk_worker, filename, file_bytes)
+                for filename, file_bytes in uploaded_files
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def answer_question(
+        self,
+        question: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        ef_search: Optional[int] = None,
+    ):
+        """
+        Answer a question with retrieval, generation, and verification.
+
+        Args:
+            question: User's question
+            on_token: Optional callback receiving answer text chunks as they are
+                generated (requires an LLM adapter with stream())
+            ef_search: Optional HNSW beam width for retrieval (higher = better
+                recall, slower); defaults to the value derived from top_k
+        """
         logger.info("Answering question with top_k=%d", self.top_k)
-        source_docs = self._retrieve(question)
+        source_docs = self._cap_context(self._retrieve(question, ef_search=ef_search))
         logger.info("Retrieved %d docs for question", len(source_docs))
-        for idx, doc in enumerate(source_docs[:3]):
-            preview = (doc.page_content or "").replace("\n", " ")
-            logger.info("Doc %d meta=%s preview=%s", idx, doc.metadata, preview[:200])
-        context = "\n\n".join(doc.page_content for doc in source_docs)
-        prompt = QA_PROMPT.safe_substitute(context=context, question=question)
-        llm_response = self.llm.invoke(prompt)
-        answer = getattr(llm_response, "content", llm_response)
         contexts = [doc.page_content for doc in source_docs]
-        verification = self.verifier.verify(question, answer, contexts)
+        if logger.isEnabledFor(logging.INFO):
+            for idx, (doc, text) in enumerate(zip(source_docs[:3], contexts)):
+                preview = (text or "")[:200].replace("\n", " ")
+                logger.info("Doc %d meta=%s preview=%s", idx, doc.metadata, preview)
+        context = "\n\n".join(contexts)
+        prompt = QA_PROMPT.format(context=context, question=question)
+        if on_token is not None and hasattr(self.llm, "stream"):
+            pieces = []
+            for piece in self.llm.stream(prompt):
+                pieces.append(piece)
+                on_token(piece)
+            answer = "".join(pieces)
+        else:
+            llm_response = self.llm.invoke(prompt)
+            answer = getattr(llm_response, "content", llm_response)
+        verification = self.verifier.verify(
+            question, answer, contexts, joined_context_lower=context.lower()
+        )
 
         # Log for future RL training
         self.training_logger.log_interaction(
@@ -157,7 +364,49 @@ class RAGService:
             "verification": verification,
         }
 
-    def answer_question_rlvr(self, question: str):
+    def answer_question_batch(self, questions: Sequence[str]) -> List[Dict]:
+        """
+        Answer several questions with batched retrieval, generation and verification.
+
+        Intended for evaluation and benchmarking loops over a QA set.
+
+        Args:
+            questions: Questions to answer
+
+        Returns:
+            One result dictionary per question (same shape as answer_question())
+        """
+        logger.info("Answering batch of %d questions with top_k=%d", len(questions), self.top_k)
+        all_docs = [self._cap_context(docs) for docs in self._retrieve_batch(questions)]
+        all_contexts = [[doc.page_content for doc in docs] for docs in all_docs]
+        joined_contexts = ["\n\n".join(contexts) for contexts in all_contexts]
+        prompts = [
+            QA_PROMPT.format(context=context, question=question)
+            for question, context in zip(questions, joined_contexts)
+        ]
+        # Through the port, so a caching wrapper can serve repeated prompts
+        responses = self.llm.invoke_batch(prompts)
+        answers = [getattr(response, "content", response) for response in responses]
+        verifications = self.verifier.verify_batch(
+            list(zip(questions, answers, all_contexts)),
+            [context.lower() for context in joined_contexts],
+        )
+
+        results = []
+        for question, answer, docs, contexts, verification in zip(
+            questions, answers, all_docs, all_contexts, verifications
+        ):
+            self.training_logger.log_interaction(
+                question=question,
+                answer=answer,
+                contexts=contexts,
+                verification_scores=verification,
+                sources=docs,
+            )
+            results.append({"answer": answer, "sources": docs, "verification": verification})
+        return results
+
+    def answer_question_rlvr(self, question: str, ef_search: Optional[int] = None):
         """
         Answer question using RLVR multi-candidate generation and selection.
 
@@ -170,33 +419,36 @@ class RAGService:
 
         Args:
             question: User's question
+            ef_search: Optional HNSW beam width for retrieval; RLVR callers can
+                raise it for higher-recall context in training signals
 
         Returns:
             Dictionary with:
             - answer: Best selected answer
             - sources: Retrieved source documents
             - verification: RAGAS verification scores
-            - rlvr_candidates: All generated candidates with rewards
+            - rlvr_candidates: All generated candidates with rewards and
+              per-candidate verification scores
             - rlvr_best_index: Index of selected candidate
         """
         if self.rlvr_candidate_service is None:
             logger.warning("RLVR mode requested but no candidate service configured; falling back to standard mode")
-            return self.answer_question(question)
+            return self.answer_question(question, ef_search=ef_search)
 
         logger.info("Answering question with RLVR mode (top_k=%d)", self.top_k)
 
         # Step 1: Retrieve context
-        source_docs = self._retrieve(question)
+        source_docs = self._cap_context(self._retrieve(question, ef_search=ef_search))
         logger.info("Retrieved %d docs for RLVR question", len(source_docs))
 
-        context = "\n\n".join(doc.page_content for doc in source_docs)
-        prompt_template = QA_PROMPT.template
+        contexts = [doc.page_content for doc in source_docs]
+        context = "\n\n".join(contexts)
+        prompt = QA_PROMPT.format(context=context, question=question)
 
-        # Step 2: Generate and score multiple candidates
+        # Step 2: Generate and score multiple candidates from the one prompt
         rlvr_result = self.rlvr_candidate_service.generate_and_score_candidates(
             question=question,
-            context=context,
-            prompt_template=prompt_template,
+            prompt=prompt,
         )
 
         answer = rlvr_result["best_answer"]
@@ -204,23 +456,31 @@ class RAGService:
         best_index = rlvr_result["best_index"]
 
         logger.info(
-            f"RLVR selected best answer (index={best_index}, "
-            f"reward={candidates[best_index]['reward']:.3f})"
+            "RLVR selected best answer (index=%d, reward=%.3f)",
+            best_index,
+            candidates[best_index]["reward"],
         )
 
-        # Step 3: Verify best answer with RAGAS
-        contexts = [doc.page_content for doc in source_docs]
-        verification = self.verifier.verify(question, answer, contexts)
-
-        # Step 4: Log for DPO training
+        # Step 3: Log for DPO training in the background; it needs only the
+        # candidates, so the disk write overlaps with verification
+        dpo_log = None
         if self.rlvr_training_logger:
-            self.rlvr_training_logger.log_candidates(
+            dpo_log = self._logging_executor.submit(
+                self.rlvr_training_logger.log_candidates,
                 question=question,
                 context=context,
                 candidates=candidates,
                 best_index=best_index,
             )
 
+        # Step 4: Verify every candidate with RAGAS in one batch
+        answers = [c["answer"] for c in candidates] or [answer]
+        verifications = self.verifier.verify_batch(
+            [(question, candidate_answer, contexts) for candidate_answer in answers],
+            [context.lower()] * len(answers),
+        )
+        verification = verifications[best_index] if candidates else verifications[0]
+
         # Also log to regular training logger for consistency
         self.training_logger.log_interaction(
             question=question,
@@ -229,6 +489,10 @@ class RAGService:
             verification_scores=verification,
             sources=source_docs,
         )
+        if dpo_log is not None:
+            dpo_log.result()
+        for candidate, candidate_verification in zip(candidates, verifications):
+            candidate["verification"] = candidate_verification
 
         return {
             "answer": answer,
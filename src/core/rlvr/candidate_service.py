@@ -10,6 +10,7 @@ This core service implements the RLVR algorithm:
 This is CORE DOMAIN LOGIC - it depends only on ports, never on adapters.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from datetime import datetime
 
@@ -51,16 +52,17 @@ class RLVRCandidateService:
     def generate_and_score_candidates(
         self,
         question: str,
-        context: str,
-        prompt_template: str,
+        prompt: str,
     ) -> Dict:
         """
         Generate multiple candidates, score them, and select the best.
 
+        Retrieval and prompt rendering happen once in the caller; every
+        candidate is generated from the same rendered prompt.
+
         Args:
-            question: User's question
-            context: Retrieved context for answering
-            prompt_template: Prompt template (with {context} and {question} placeholders)
+            question: User's question (used for reward computation)
+            prompt: Fully rendered prompt (question plus retrieved context)
 
         Returns:
             Dictionary with:
@@ -68,46 +70,38 @@ class RLVRCandidateService:
             - candidates: List of all candidates with rewards
             - best_index: Index of best candidate
         """
-        # Build prompt
-        prompt = prompt_template.format(context=context, question=question)
-
-        candidates = []
-
         logger.info(f"Generating {self.num_candidates} RLVR candidates...")
 
         # Generate multiple candidates
         # Note: Ollama/OpenAI don't expose seed directly, so we use temperature variation
         temperatures = [0.0, 0.3, 0.7][:self.num_candidates]
 
-        for idx, temp in enumerate(temperatures):
-            try:
-                # Generate answer
-                # Note: We'd need to update LLMPort to accept temperature
-                # For now, just generate with default settings
-                response = self.llm.invoke(prompt)
-                answer = getattr(response, "content", str(response))
-
-                # Compute reward
-                reward = self.reward_function.compute_reward(question, answer)
-
-                candidates.append({
-                    "answer": answer,
-                    "reward": reward,
-                    "temperature": temp,
-                    "index": idx,
-                })
-
-                logger.debug(f"Candidate {idx}: reward={reward:.3f}, answer={answer[:100]}...")
-
-            except Exception as e:
-                logger.error(f"Failed to generate candidate {idx}: {e}")
-                # Add failed candidate
-                candidates.append({
-                    "answer": f"[Generation failed: {e}]",
-                    "reward": 0.0,
-                    "temperature": temp,
-                    "index": idx,
-                })
+        if not getattr(self.llm, "supports_sampling", False):
+            # Without per-call sampling every call would see the same prompt and
+            # settings, so one generation stands in for all candidates.
+            logger.warning("LLM adapter ignores temperature/seed; generating one answer for all candidates")
+            first = self._generate_candidate(question, prompt, 0, temperatures[0]) if temperatures else None
+            candidates = [
+                {**first, "temperature": temp, "index": idx}
+                for idx, temp in enumerate(temperatures)
+            ]
+        elif hasattr(self.llm, "invoke_batch"):
+            # One batched request set; the candidate index doubles as the seed
+            responses = self.llm.invoke_batch(
+                [prompt] * len(temperatures),
+                temperatures=temperatures,
+                seeds=list(range(len(temperatures))),
+                return_exceptions=True,
+            )
+            candidates = self._score_candidates(question, responses, temperatures)
+        else:
+            # Candidates are independent network-bound LLM calls, so issue them
+            # concurrently; map() keeps results in candidate order.
+            with ThreadPoolExecutor(max_workers=max(1, len(temperatures))) as executor:
+                candidates = list(executor.map(
+                    lambda args: self._generate_candidate(question, prompt, *args),
+                    enumerate(temperatures),
+                ))
 
         # Select best candidate
         if not candidates:
@@ -130,3 +124,74 @@ class RLVRCandidateService:
             "candidates": candidates,
             "best_index": best_idx,
         }
+
+    def _generate_candidate(self, question: str, prompt: str, idx: int, temp: float) -> Dict:
+        """Generate and score one candidate; failures become zero-reward candidates."""
+        try:
+            # Generate answer; the candidate index doubles as the sampling seed
+            if getattr(self.llm, "supports_sampling", False):
+                response = self.llm.invoke(prompt, temperature=temp, seed=idx)
+            else:
+                response = self.llm.invoke(prompt)
+        except Exception as e:
+            response = e
+        return self._score_candidate(question, response, idx, temp)
+
+    def _score_candidates(self, question: str, responses: List, temperatures: List[float]) -> List[Dict]:
+        """Score generated responses with one batched reward call; failed generations score zero."""
+        compute_batch = getattr(self.reward_function, "compute_reward_batch", None)
+        if compute_batch is not None:
+            answered = [idx for idx, response in enumerate(responses) if not isinstance(response, Exception)]
+            answers = {idx: getattr(responses[idx], "content", str(responses[idx])) for idx in answered}
+            try:
+                rewards = dict(zip(answered, compute_batch(question, [answers[idx] for idx in answered])))
+            except Exception as e:
+                logger.error(f"Batched reward computation failed, scoring candidates one by one: {e}")
+            else:
+                candidates = []
+                for idx, (response, temp) in enumerate(zip(responses, temperatures)):
+                    if idx not in rewards:
+                        candidates.append(self._score_candidate(question, response, idx, temp))
+                        continue
+                    logger.debug(f"Candidate {idx}: reward={rewards[idx]:.3f}, answer={answers[idx][:100]}...")
+                    candidates.append({
+                        "answer": answers[idx],
+                        "reward": rewards[idx],
+                        "temperature": temp,
+                        "index": idx,
+                    })
+                return candidates
+
+        return [
+            self._score_candidate(question, response, idx, temp)
+            for idx, (response, temp) in enumerate(zip(responses, temperatures))
+        ]
+
+    def _score_candidate(self, question: str, response, idx: int, temp: float) -> Dict:
+        """Score one generated response; a failed generation (exception) becomes a zero-reward candidate."""
+        try:
+            if isinstance(response, Exception):
+                raise response
+            answer = getattr(response, "content", str(response))
+
+            # Compute reward
+            reward = self.reward_function.compute_reward(question, answer)
+
+            logger.debug(f"Candidate {idx}: reward={reward:.3f}, answer={answer[:100]}...")
+
+            return {
+                "answer": answer,
+                "reward": reward,
+                "temperature": temp,
+                "index": idx,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to generate candidate {idx}: {e}")
+            # Add failed candidate
+            return {
+                "answer": f"[Generation failed: {e}]",
+                "reward": 0.0,
+                "temperature": temp,
+                "index": idx,
+            }
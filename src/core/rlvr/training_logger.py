@@ -10,18 +10,26 @@ Each log entry contains:
 - The chosen best candidate
 - Timestamp for tracking
 
-This is CORE DOMAIN LOGIC - it depends only on standard library.
+This is CORE DOMAIN LOGIC - it depends only on the standard library and orjson.
 """
 
-import json
+import atexit
+import mmap
+import threading
 from pathlib import Path
-from typing import Dict, List
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
 
+import orjson
+
+from src.core.jsonl_writer import JSONLWriter, write_json_atomic
 from src.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Persist the running totals every N logged sessions (and at exit)
+_STATS_PERSIST_EVERY = 16
+
 
 class RLVRTrainingLogger:
     """
@@ -32,15 +40,28 @@ class RLVRTrainingLogger:
     later DPO training.
     """
 
-    def __init__(self, log_path: Path | str = "training_data/rlvr_training.jsonl"):
+    def __init__(self, log_path: Path | str = "training_data/rlvr_training.jsonl", flush_every: int = 1):
         """
         Initialize RLVR training logger.
 
         Args:
             log_path: Path to JSONL log file (created if doesn't exist)
+            flush_every: Flush the append handle every N entries (raise for
+                high-throughput evaluation runs)
         """
         self.log_path = Path(log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = JSONLWriter(flush_every=flush_every)
+
+        # Running totals sidecar so get_training_stats() does not rescan the log
+        self._stats_path = self.log_path.with_suffix(".stats.json")
+        self._stats_lock = threading.Lock()
+        self._unsaved_stats = 0
+        # [size, mtime_ns] of the log the totals cover; the size advances with our own writes
+        self._log_file: List[int] = [0, 0]
+        self._stats = self._empty_stats()
+        self._stats = self._load_stats()
+        atexit.register(self._persist_stats)
         logger.info(f"RLVR Training Logger initialized: {self.log_path}")
 
     def log_candidates(
@@ -61,7 +82,7 @@ class RLVRTrainingLogger:
         """
         # Create log entry
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc),  # orjson writes ISO-8601
             "question": question,
             "context_snippet": context[:1000],  # First 1000 chars to save space
             "candidates": [
@@ -79,8 +100,7 @@ class RLVRTrainingLogger:
 
         # Append to JSONL file
         try:
-            with self.log_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+            self._record_stats(log_entry, orjson.dumps(log_entry, option=orjson.OPT_SERIALIZE_NUMPY))
 
             logger.debug(
                 f"Logged RLVR training entry: "
@@ -92,53 +112,139 @@ class RLVRTrainingLogger:
         except Exception as e:
             logger.error(f"Failed to log RLVR training data: {e}")
 
-    def get_training_stats(self) -> Dict:
+    def get_training_stats(self, recompute: bool = False) -> Dict:
         """
         Get statistics about logged training data.
 
+        The totals are rebuilt automatically when the log no longer has the
+        size they were counted from (another process appended to it, or it
+        was edited or removed).
+
+        Args:
+            recompute: Rebuild the running totals by rescanning the log even
+                if it looks unchanged
+
         Returns:
             Dictionary with counts, average rewards, etc.
         """
-        if not self.log_path.exists():
+        with self._stats_lock:
+            self._writer.flush()
+            current = self._file_snapshot()
+            rescan = recompute or current[0] != self._log_file[0]
+            if rescan:
+                if not recompute:
+                    logger.info(f"{self.log_path} changed outside this logger; rescanning")
+                self._rescan(current)
+            stats = dict(self._stats)
+        if rescan:
+            self._persist_stats()
+
+        if not stats["entries"]:
             return {
                 "total_entries": 0,
                 "total_candidates": 0,
                 "avg_best_reward": 0.0,
             }
 
+        return {
+            "total_entries": stats["entries"],
+            "total_candidates": stats["candidates"],
+            "avg_best_reward": stats["best_reward_sum"] / stats["best_count"] if stats["best_count"] else 0.0,
+            "avg_candidates_per_entry": stats["candidates"] / stats["entries"],
+        }
+
+    def _record_stats(self, entry: Dict, line: bytes) -> None:
+        """Append one logged session to the log and add it to the running totals."""
+        with self._stats_lock:
+            # Written under the stats lock so the tracked log size always matches the totals
+            self._writer.write_line(self.log_path, line)
+            self._log_file[0] += len(line) + 1
+            self._add_entry(self._stats, entry)
+            self._unsaved_stats += 1
+            persist = self._unsaved_stats >= _STATS_PERSIST_EVERY
+        if persist:
+            self._persist_stats()
+
+    @staticmethod
+    def _add_entry(stats: Dict, entry: Dict) -> None:
+        stats["entries"] += 1
+        stats["candidates"] += entry["num_candidates"]
+        if entry["candidates"]:
+            stats["best_reward_sum"] += entry["candidates"][entry["chosen_index"]]["reward"]
+            stats["best_count"] += 1
+
+    def _load_stats(self) -> Dict:
+        """
+        Load running totals from the sidecar.
+
+        They are rebuilt from the log if the sidecar is missing or unreadable,
+        or if its size/mtime snapshot does not match the log file.
+        """
+        current = self._file_snapshot()
         try:
-            entries = []
-            with self.log_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        entries.append(json.loads(line))
-
-            if not entries:
-                return {
-                    "total_entries": 0,
-                    "total_candidates": 0,
-                    "avg_best_reward": 0.0,
-                }
+            stats = orjson.loads(self._stats_path.read_bytes())
+            keys = ("entries", "candidates", "best_reward_sum", "best_count")
+            if set(keys) <= stats.keys() and stats.get("file") == current:
+                self._log_file = current
+                return {key: stats[key] for key in keys}
+        except (OSError, orjson.JSONDecodeError):
+            pass
+        self._rescan(current)
+        return self._stats
+
+    def _persist_stats(self) -> None:
+        """Atomically write the running totals if they changed since the last write."""
+        with self._stats_lock:
+            if not self._unsaved_stats:
+                return
+            self._writer.flush()
+            current = self._file_snapshot()
+            if current[0] == self._log_file[0]:
+                self._log_file = current  # refresh the mtime for the next startup check
+            # On a mismatch the stale snapshot is saved, so the next load rescans
+            stats = dict(self._stats, file=self._log_file)
+            self._unsaved_stats = 0
+        try:
+            write_json_atomic(self._stats_path, stats)
+        except OSError as e:
+            logger.error(f"Failed to persist RLVR training stats: {e}")
 
-            total_candidates = sum(e["num_candidates"] for e in entries)
-            best_rewards = [
-                e["candidates"][e["chosen_index"]]["reward"]
-                for e in entries
-                if e["candidates"]
-            ]
-            avg_best_reward = sum(best_rewards) / len(best_rewards) if best_rewards else 0.0
+    def _file_snapshot(self) -> List[int]:
+        """[size, mtime_ns] of the log file ([0, 0] if it does not exist yet)."""
+        try:
+            st = self.log_path.stat()
+        except FileNotFoundError:
+            return [0, 0]
+        return [st.st_size, st.st_mtime_ns]
 
-            return {
-                "total_entries": len(entries),
-                "total_candidates": total_candidates,
-                "avg_best_reward": avg_best_reward,
-                "avg_candidates_per_entry": total_candidates / len(entries),
-            }
+    def _rescan(self, current: Optional[List[int]] = None) -> None:
+        """
+        Rebuild the totals from the log (caller holds the stats lock, or is __init__).
 
+        If the log cannot be parsed the current totals are kept, and the
+        snapshot is still advanced so the failed scan is not retried on
+        every call.
+        """
+        try:
+            self._stats = self._scan_stats()
         except Exception as e:
             logger.error(f"Failed to compute training stats: {e}")
-            return {
-                "total_entries": 0,
-                "total_candidates": 0,
-                "avg_best_reward": 0.0,
-            }
+        self._log_file = current or self._file_snapshot()
+        self._unsaved_stats = 1
+
+    def _scan_stats(self) -> Dict:
+        """Compute running totals from scratch by reading every log line."""
+        self._writer.flush()
+        stats = self._empty_stats()
+        if not self.log_path.exists() or self.log_path.stat().st_size == 0:
+            return stats  # mmap cannot map an empty file
+        # Constant-memory pass: entries are folded into the totals one at a time
+        with self.log_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    self._add_entry(stats, orjson.loads(line))
+        return stats
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {"entries": 0, "candidates": 0, "best_reward_sum": 0.0, "best_count": 0}
@@ -4,20 +4,32 @@ Training data logger for RLVR
 Logs all Q&A interactions with verification scores for future RL fine-tuning.
 """
 
-import json
-from datetime import datetime
+import atexit
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List
 
+import orjson
+
+from src.core.jsonl_writer import JSONLWriter, write_json_atomic
 from src.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Running totals sidecar (not *.jsonl, so log scans skip it)
+_STATS_FILE = "training_stats.json"
+# Monthly log files this logger writes and counts
+_LOG_GLOB = "training_data_*.jsonl"
+# Persist the running totals every N logged interactions (and at exit)
+_STATS_PERSIST_EVERY = 16
+
 
 class TrainingDataLogger:
     """Log Q&A pairs with verification scores for future RL training."""
 
-    def __init__(self, log_dir: str = "training_data", enabled: bool = True):
+    def __init__(self, log_dir: str = "training_data", enabled: bool = True, flush_every: int = 1):
         self.enabled = enabled
         if not enabled:
             logger.info("Training data logging is DISABLED")
@@ -25,6 +37,18 @@ class TrainingDataLogger:
 
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
+        self._writer = JSONLWriter(flush_every=flush_every)
+        self._log_month: tuple[int, int] | None = None
+        self._log_file: Path | None = None
+
+        # Running totals so get_stats() does not rescan every log line
+        self._stats_path = self.log_dir / _STATS_FILE
+        self._stats_lock = threading.Lock()
+        self._unsaved_stats = 0
+        # Log file name -> [size, mtime_ns] the totals cover; sizes advance with our own writes
+        self._files: Dict[str, List[int]] = {}
+        self._stats = self._load_stats()
+        atexit.register(self._persist_stats)
         logger.info("Training data logging enabled, directory: %s", self.log_dir)
 
     def log_interaction(
@@ -42,7 +66,7 @@ class TrainingDataLogger:
         try:
             # Prepare data
             data = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc),  # orjson writes ISO-8601
                 "question": question,
                 "answer": answer,
                 "contexts": contexts,
@@ -58,9 +82,9 @@ class TrainingDataLogger:
             }
 
             # Log to monthly JSONL file (one JSON object per line)
-            log_file = self.log_dir / f"training_data_{datetime.now().strftime('%Y%m')}.jsonl"
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(data, ensure_ascii=False) + "\n")
+            log_file = self._monthly_log_file()
+            line = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+            self._record_stats(log_file, line, verification_scores.get("overall_score", 0.0))
 
             logger.debug(
                 "Logged interaction: score=%.3f, question=%s",
@@ -71,31 +95,147 @@ class TrainingDataLogger:
         except Exception as e:
             logger.error("Failed to log training data: %s", e)
 
-    def get_stats(self) -> Dict:
-        """Get statistics about logged training data."""
+    def _monthly_log_file(self) -> Path:
+        """Path of the current month's log file, built once per month."""
+        now = time.localtime()
+        month = (now.tm_year, now.tm_mon)
+        if month != self._log_month:
+            self._log_month = month
+            self._log_file = self.log_dir / f"training_data_{now.tm_year}{now.tm_mon:02d}.jsonl"
+        return self._log_file
+
+    def get_stats(self, recompute: bool = False) -> Dict:
+        """
+        Get statistics about logged training data.
+
+        The totals are rebuilt automatically when the log files no longer
+        match the sizes they were counted from (e.g. another process logged
+        to the same directory, or a file was edited or removed).
+
+        Args:
+            recompute: Rebuild the running totals by rescanning every log file
+                even if the files look unchanged
+        """
         if not self.enabled:
             return {"enabled": False}
 
+        with self._stats_lock:
+            self._writer.flush()
+            rescan = recompute or not self._sizes_match(self._file_snapshot())
+            if rescan:
+                if not recompute:
+                    logger.info("Training logs in %s changed outside this logger; rescanning", self.log_dir)
+                self._rescan()
+            total_interactions = self._stats["count"]
+            score_sum = self._stats["score_sum"]
+            high_score_count = self._stats["high_count"]
+        if rescan:
+            self._persist_stats()
+
+        avg_score = score_sum / total_interactions if total_interactions > 0 else 0
+
+        return {
+            "enabled": True,
+            "total_interactions": total_interactions,
+            "average_score": avg_score,
+            "high_quality_count": high_score_count,
+            "high_quality_percentage": (high_score_count / total_interactions * 100) if total_interactions > 0 else 0,
+        }
+
+    def _record_stats(self, log_file: Path, line: bytes, score: float) -> None:
+        """Append one interaction to its log file and add it to the running totals."""
+        with self._stats_lock:
+            # Written under the stats lock so the tracked file sizes always match the totals
+            self._writer.write_line(log_file, line)
+            self._files.setdefault(log_file.name, [0, 0])[0] += len(line) + 1
+            self._stats["count"] += 1
+            self._stats["score_sum"] += score
+            if score >= 0.8:
+                self._stats["high_count"] += 1
+            self._unsaved_stats += 1
+            persist = self._unsaved_stats >= _STATS_PERSIST_EVERY
+        if persist:
+            self._persist_stats()
+
+    def _load_stats(self) -> Dict:
+        """
+        Load running totals from the sidecar.
+
+        They are rebuilt from the logs if the sidecar is missing or unreadable,
+        or if its file snapshot does not match the log directory.
+        """
+        current = self._file_snapshot()
+        try:
+            stats = orjson.loads(self._stats_path.read_bytes())
+            if {"count", "score_sum", "high_count"} <= stats.keys() and stats.get("files") == current:
+                self._files = current
+                return {key: stats[key] for key in ("count", "score_sum", "high_count")}
+        except (OSError, orjson.JSONDecodeError):
+            pass
+        stats = self._scan_stats()
+        self._files = self._file_snapshot()
+        self._unsaved_stats = 1
+        return stats
+
+    def _persist_stats(self) -> None:
+        """Atomically write the running totals if they changed since the last write."""
+        with self._stats_lock:
+            if not self._unsaved_stats:
+                return
+            self._writer.flush()
+            current = self._file_snapshot()
+            if self._sizes_match(current):
+                self._files = current  # refresh mtimes for the next startup check
+            # On a mismatch the stale snapshot is saved, so the next load rescans
+            stats = dict(self._stats, files=self._files)
+            self._unsaved_stats = 0
+        try:
+            write_json_atomic(self._stats_path, stats)
+        except OSError as e:
+            logger.error("Failed to persist training stats: %s", e)
+
+    def _file_snapshot(self) -> Dict[str, List[int]]:
+        """[size, mtime_ns] of every log file, keyed by file name."""
+        snapshot = {}
+        for log_file in self.log_dir.glob(_LOG_GLOB):
+            st = log_file.stat()
+            snapshot[log_file.name] = [st.st_size, st.st_mtime_ns]
+        return snapshot
+
+    def _sizes_match(self, snapshot: Dict[str, List[int]]) -> bool:
+        """Whether the log files have exactly the sizes the totals were counted from."""
+        return {name: size for name, (size, _) in snapshot.items()} == {
+            name: size for name, (size, _) in self._files.items()
+        }
+
+    def _rescan(self) -> None:
+        """Rebuild the totals and file snapshot from the logs (caller holds the stats lock)."""
+        self._stats = self._scan_stats()
+        self._files = self._file_snapshot()
+        self._unsaved_stats = 1
+
+    def _scan_stats(self) -> Dict:
+        """Compute running totals from scratch by reading every log line."""
+        self._writer.flush()
         total_interactions = 0
         score_sum = 0.0
         high_score_count = 0
 
-        for log_file in self.log_dir.glob("*.jsonl"):
-            with open(log_file, encoding="utf-8") as f:
+        for log_file in self.log_dir.glob(_LOG_GLOB):
+            with open(log_file, "rb") as f:
                 for line in f:
-                    data = json.loads(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        data = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # truncated tail or corrupt line
+                    if "verification" not in data:
+                        continue  # not an interaction record
                     total_interactions += 1
                     score = data["verification"]["overall_score"]
                     score_sum += score
                     if score >= 0.8:
                         high_score_count += 1
 
-        avg_score = score_sum / total_interactions if total_interactions > 0 else 0
-
-        return {
-            "enabled": True,
-            "total_interactions": total_interactions,
-            "average_score": avg_score,
-            "high_quality_count": high_score_count,
-            "high_quality_percentage": (high_score_count / total_interactions * 100) if total_interactions > 0 else 0,
-        }
+        return {"count": total_interactions, "score_sum": score_sum, "high_count": high_score_count}
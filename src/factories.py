@@ -10,18 +10,20 @@ based on configuration. This is where hexagonal architecture comes alive:
 - Core domain receives ports, not concrete adapters
 
 This ensures the core domain is decoupled from infrastructure.
+
+Adapter factories are memoized: heavy adapters (embedding model, Qdrant
+client, LLM clients) are built once per process and shared, so they must be
+safe to use from several sessions/threads at once. Adapter modules are
+imported inside their factory, so only the selected backend's dependencies
+are loaded.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from src.config import settings
-from src.adapters.output.embedding import HashingAdapter, OpenAIEmbeddingAdapter, SentenceTransformerAdapter
-from src.adapters.output.llm import ChatOllamaAdapter, ChatOpenAIAdapter
-from src.adapters.output.vectorstore import QdrantAdapter
-from src.adapters.output.verification import RagasAdapter
-from src.adapters.output.pdf_processor import PDFPlumberAdapter
-from src.adapters.output.reward import PricingRewardAdapter
-from src.core import RAGService
+from src.core import RAGService, TrainingDataLogger
 from src.core.rlvr import RLVRCandidateService, RLVRTrainingLogger
 from src.logging import get_logger
 from src.ports.output import EmbeddingsPort, LLMPort, PDFProcessorPort, RewardPort, VerificationPort, VectorStorePort
@@ -29,41 +31,79 @@ from src.ports.output import EmbeddingsPort, LLMPort, PDFProcessorPort, RewardPo
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
 def create_embeddings() -> EmbeddingsPort:
     backend = getattr(settings.embedding, "backend", "sentence").lower()
     if backend == "hashing":
+        from src.adapters.output.embedding.hashing import HashingAdapter
+
         logger.info("Using hashing embeddings (offline, no download)")
         return HashingAdapter()
     if backend == "openai":
+        from src.adapters.output.embedding.openai import OpenAIEmbeddingAdapter
+
         logger.info("Using OpenAI embeddings backend")
         return OpenAIEmbeddingAdapter()
+    from src.adapters.output.embedding.sentence import SentenceTransformerAdapter
+
     logger.info("Using sentence-transformer embeddings backend")
     return SentenceTransformerAdapter()
 
 
+def warm_up_embeddings() -> None:
+    """Start loading the configured local embedding model in the background."""
+    backend = getattr(settings.embedding, "backend", "sentence").lower()
+    if backend not in ("hashing", "openai"):
+        from src.adapters.output.embedding.sentence import start_background_warmup
+
+        logger.info("Warming up sentence-transformer model in the background")
+        start_background_warmup()
+
+
+@lru_cache(maxsize=4)  # keyed on the embeddings adapter instance
 def create_vector_store(embeddings: EmbeddingsPort) -> VectorStorePort:
     backend = settings.vector_store.backend.lower()
     if backend == "qdrant":
+        from src.adapters.output.vectorstore.qdrant import QdrantAdapter
+
         return QdrantAdapter(embeddings=embeddings)
     raise ValueError(f"Unsupported VECTOR_STORE_BACKEND: {backend}")
 
 
+@lru_cache(maxsize=1)
 def create_llm() -> LLMPort:
     backend = settings.llm.backend.lower()
     if backend == "ollama":
-        return ChatOllamaAdapter()
-    if backend == "openai":
-        return ChatOpenAIAdapter()
-    raise ValueError(f"Unsupported LLM_BACKEND: {backend}")
+        from src.adapters.output.llm.ollama import ChatOllamaAdapter
+
+        llm = ChatOllamaAdapter()
+    elif backend == "openai":
+        from src.adapters.output.llm.openai import ChatOpenAIAdapter
 
+        llm = ChatOpenAIAdapter()
+    else:
+        raise ValueError(f"Unsupported LLM_BACKEND: {backend}")
 
+    if settings.llm.cache_enabled:
+        from src.adapters.output.llm.cache import CachedLLMAdapter
+
+        return CachedLLMAdapter(llm, path=settings.llm.cache_path)
+    return llm
+
+
+@lru_cache(maxsize=1)
 def create_pdf_processor() -> PDFProcessorPort:
     """Create PDF processor adapter."""
+    from src.adapters.output.pdf_processor.pdfplumber import PDFPlumberAdapter
+
     return PDFPlumberAdapter()
 
 
+@lru_cache(maxsize=1)
 def create_verifier() -> VerificationPort:
     """Create verification adapter (RAGAS)."""
+    from src.adapters.output.verification.ragas import RagasAdapter
+
     return RagasAdapter()
 
 
@@ -93,9 +133,11 @@ def create_rag_service(embeddings: EmbeddingsPort | None = None) -> RAGService:
         verifier=verifier,
         llm=llm,
         top_k=settings.retrieval.top_k,
+        training_logger=create_training_logger(),
     )
 
 
+@lru_cache(maxsize=1)
 def create_reward_function() -> RewardPort:
     """
     Create reward function adapter for RLVR.
@@ -106,6 +148,8 @@ def create_reward_function() -> RewardPort:
     Returns:
         Reward function adapter implementing RewardPort
     """
+    from src.adapters.output.reward.pricing_reward import PricingRewardAdapter
+
     logger.info("Creating pricing reward adapter for RLVR")
     return PricingRewardAdapter()
 
@@ -140,6 +184,26 @@ def create_rlvr_candidate_service(
     )
 
 
+@lru_cache(maxsize=None)  # one writer and one set of running totals per directory
+def create_training_logger(log_dir: str = "training_data") -> TrainingDataLogger:
+    """
+    Create the Q&A training data logger shared by every RAG service.
+
+    Each logger keeps running totals and persists them to the directory's
+    stats sidecar, so a single instance per directory keeps concurrent
+    sessions from overwriting each other's counts.
+
+    Args:
+        log_dir: Directory for the monthly JSONL logs
+
+    Returns:
+        Shared TrainingDataLogger instance
+    """
+    logger.info(f"Creating training data logger: {log_dir}")
+    return TrainingDataLogger(log_dir=log_dir)
+
+
+@lru_cache(maxsize=None)  # one writer per log file
 def create_rlvr_training_logger(log_path: str = "training_data/rlvr_training.jsonl") -> RLVRTrainingLogger:
     """
     Create RLVR training logger for JSONL output.
@@ -204,9 +268,30 @@ def create_rag_service_with_rlvr(
         top_k=settings.retrieval.top_k,
         rlvr_candidate_service=rlvr_candidate_service,
         rlvr_training_logger=rlvr_training_logger,
+        training_logger=create_training_logger(),
     )
 
 
+def invalidate_factory_cache() -> None:
+    """
+    Drop all memoized adapters so the next factory call rebuilds them.
+
+    Use after changing settings that select or configure an adapter (e.g. in
+    tests or when switching backends at runtime).
+    """
+    for factory in (
+        create_embeddings,
+        create_vector_store,
+        create_llm,
+        create_pdf_processor,
+        create_verifier,
+        create_reward_function,
+        create_training_logger,
+        create_rlvr_training_logger,
+    ):
+        factory.cache_clear()
+
+
 # Backward compatibility alias
 build_service = create_rag_service
 
@@ -1,21 +1,44 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Set once the handlers are attached; Streamlit reruns only adjust the level.
+_CONFIGURED = False
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+
 
 def configure_logging(level: int = logging.INFO) -> None:
-    """Configure application-wide logging with a concise formatter."""
-    handler = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    handler.setFormatter(formatter)
+    """
+    Configure application-wide logging with a concise formatter.
+
+    Logger calls only enqueue records; a background listener thread formats
+    them and writes to stdout, so threads logging concurrently (e.g. RLVR
+    candidate generation) do not contend on the stream lock or wait on I/O.
+    """
+    global _CONFIGURED, _LISTENER
     root = logging.getLogger()
     root.setLevel(level)
-    # Avoid adding multiple handlers in Streamlit reruns.
-    if not any(isinstance(h, logging.StreamHandler) for h in root.handlers):
-        root.addHandler(handler)
+    if _CONFIGURED:
+        return
+    # Avoid adding a second stream handler if one was set up elsewhere.
+    if not any(isinstance(h, (logging.StreamHandler, logging.handlers.QueueHandler)) for h in root.handlers):
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(_FORMATTER)
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        _LISTENER = logging.handlers.QueueListener(log_queue, stream_handler)
+        _LISTENER.start()
+        # stop() drains queued records before the interpreter exits
+        atexit.register(_LISTENER.stop)
+    _CONFIGURED = True
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -7,6 +7,17 @@ They are split into:
 - output/: Secondary/Driven ports (what the app needs)
 """
 
-# Re-export all ports for convenience
-from .input import *
-from .output import *
+# Re-export all ports for convenience. Light ports come in eagerly; the
+# langchain/numpy-backed ones resolve on first access (PEP 562).
+from .output import LLMPort, RewardPort, VerificationPort
+from . import output as _output
+
+_LAZY_EXPORTS = ("EmbeddingsPort", "VectorStorePort", "PDFProcessorPort")
+
+__all__ = ["LLMPort", "RewardPort", "VerificationPort", *_LAZY_EXPORTS]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(_output, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
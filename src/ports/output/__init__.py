@@ -8,12 +8,27 @@ Core domain depends on these interfaces.
 Output adapters (DB, APIs, etc.) implement these interfaces.
 """
 
+import importlib
+
+# Typing-only ports are imported eagerly.
 from .llm import LLMPort
-from .embedding import EmbeddingsPort
-from .vectorstore import VectorStorePort
-from .verification import VerificationPort
-from .pdf_processor import PDFProcessorPort
 from .reward import RewardPort
+from .verification import VerificationPort
+
+# These import their domain types (langchain Document, numpy) at module level,
+# so each is loaded only when its port is first accessed (PEP 562).
+_LAZY_EXPORTS = {
+    "EmbeddingsPort": ".embedding",
+    "VectorStorePort": ".vectorstore",
+    "PDFProcessorPort": ".pdf_processor",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "LLMPort",
@@ -1,20 +1,40 @@
 """Embeddings Port - Interface for embedding model adapters."""
 
-from typing import List, Protocol
+from typing import List, Protocol, Sequence
+
+import numpy as np
 
 
 class EmbeddingsPort(Protocol):
     """Port for embedding model implementations."""
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+    def embed_documents(self, texts: Sequence[str]) -> np.ndarray:
         """
         Embed a list of documents.
 
         Args:
-            texts: List of text documents to embed
+            texts: Sequence of text documents to embed (use embed_query for a single string)
+
+        Returns:
+            C-contiguous (row-major) float32 array of shape (len(texts), dim),
+            one row per document, L2-normalized so that dot product equals
+            cosine similarity (``matrix @ query`` scores all rows at once)
+        """
+        ...
+
+    def embed_documents_into(self, texts: Sequence[str], out: np.ndarray) -> np.ndarray:
+        """
+        Embed documents directly into a caller-provided array.
+
+        Lets bulk callers preallocate one (n, dim) float32 buffer (or fill a
+        slice of a larger one) instead of allocating a new array per batch.
+
+        Args:
+            texts: Sequence of text documents to embed
+            out: C-contiguous float32 array of shape (len(texts), dim)
 
         Returns:
-            List of embedding vectors (one per document)
+            ``out``, filled like embed_documents(texts)
         """
         ...
 
@@ -22,10 +42,26 @@ class EmbeddingsPort(Protocol):
         """
         Embed a single query.
 
+        Stays a list of floats because LangChain vector stores call it
+        through the Embeddings interface; use embed_queries for arrays.
+
         Args:
             query: Query text to embed
 
         Returns:
-            Embedding vector for the query
+            L2-normalized embedding vector for the query
+        """
+        ...
+
+    def embed_queries(self, queries: Sequence[str]) -> np.ndarray:
+        """
+        Embed several queries in one pass.
+
+        Args:
+            queries: Query texts to embed
+
+        Returns:
+            float32 array of shape (len(queries), dim), L2-normalized like
+            embed_query
         """
         ...
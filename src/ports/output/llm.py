@@ -1,15 +1,68 @@
 """LLM Port - Interface for Language Model adapters."""
 
-from typing import Protocol
+from typing import Iterator, List, Optional, Protocol, Sequence
 
 
 class LLMPort(Protocol):
-    """Port for Language Model implementations."""
+    """
+    Port for Language Model implementations.
 
-    def invoke(self, inputs) -> object:
+    Adapters that honour the temperature/seed arguments of invoke() set a
+    ``supports_sampling = True`` class attribute.
+    """
+
+    def invoke(self, inputs, temperature: Optional[float] = None, seed: Optional[int] = None) -> object:
         """
         Invoke the language model with given inputs.
 
+        Args:
+            inputs: Input to the language model (prompt, messages, etc.)
+            temperature: Optional sampling temperature override for this call
+            seed: Optional sampling seed for this call
+
+        Returns:
+            Model response object
+        """
+        ...
+
+    def invoke_batch(
+        self,
+        inputs: Sequence,
+        temperatures: Optional[Sequence[Optional[float]]] = None,
+        seeds: Optional[Sequence[Optional[int]]] = None,
+        return_exceptions: bool = False,
+    ) -> List[object]:
+        """
+        Invoke the language model on several inputs concurrently.
+
+        Args:
+            inputs: Inputs to the language model, one per request
+            temperatures: Optional per-input temperature overrides
+            seeds: Optional per-input sampling seeds
+            return_exceptions: Return a failed request's exception in its
+                slot instead of raising
+
+        Returns:
+            Model responses in input order
+        """
+        ...
+
+    def stream(self, inputs) -> Iterator[str]:
+        """
+        Stream the model response as it is generated.
+
+        Args:
+            inputs: Input to the language model (prompt, messages, etc.)
+
+        Yields:
+            Answer text chunks in generation order
+        """
+        ...
+
+    async def ainvoke(self, inputs) -> object:
+        """
+        Invoke the language model without blocking the event loop.
+
         Args:
             inputs: Input to the language model (prompt, messages, etc.)
 
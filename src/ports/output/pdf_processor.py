@@ -1,6 +1,6 @@
 """PDF Processor Port - Interface for PDF processing adapters."""
 
-from typing import List, Protocol
+from typing import Iterator, List, Protocol
 
 try:
     from langchain.schema import Document
@@ -9,7 +9,12 @@ except ImportError:
 
 
 class PDFProcessorPort(Protocol):
-    """Port for PDF processing implementations."""
+    """
+    Port for PDF processing implementations.
+
+    Implementations take optional ``chunk_size``/``chunk_overlap`` keyword
+    arguments so RAGService can rebuild them inside chunking worker processes.
+    """
 
     def chunk(self, file_bytes: bytes, source_name: str) -> List[Document]:
         """
@@ -23,3 +28,19 @@ class PDFProcessorPort(Protocol):
             List of Document objects (chunks)
         """
         ...
+
+    def chunk_stream(self, file_bytes: bytes, source_name: str) -> Iterator[Document]:
+        """
+        Process PDF bytes and yield chunks as each page is parsed.
+
+        Same documents, in the same order, as chunk(); lets callers start
+        embedding the first pages while later pages are still being parsed.
+
+        Args:
+            file_bytes: Raw PDF file bytes
+            source_name: Name/identifier for the source file
+
+        Yields:
+            Document objects (chunks)
+        """
+        ...
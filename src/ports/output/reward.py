@@ -1,6 +1,6 @@
 """Reward Port - Interface for RLVR reward computation."""
 
-from typing import Protocol
+from typing import List, Protocol, Sequence
 
 
 class RewardPort(Protocol):
@@ -23,3 +23,16 @@ class RewardPort(Protocol):
             Reward score between 0.0 (completely wrong) and 1.0 (perfect)
         """
         ...
+
+    def compute_reward_batch(self, question: str, answers: Sequence[str]) -> List[float]:
+        """
+        Compute rewards for several answers to the same question.
+
+        Args:
+            question: The user's question
+            answers: Candidate answers to evaluate
+
+        Returns:
+            One reward score (0.0 to 1.0) per answer, in input order
+        """
+        ...
@@ -1,6 +1,6 @@
 """Vector Store Port - Interface for vector database adapters."""
 
-from typing import Iterable, List, Protocol
+from typing import Iterable, List, Optional, Protocol
 
 try:
     from langchain.schema import Document
@@ -23,6 +23,33 @@ class VectorStorePort(Protocol):
         """
         ...
 
+    def add_documents_with_vectors(self, documents: List[Document], vectors) -> List[str]:
+        """
+        Add documents with embeddings computed by the caller.
+
+        Args:
+            documents: Document objects to add
+            vectors: One embedding per document, in the same order
+
+        Returns:
+            List of document IDs
+        """
+        ...
+
+    def search_batch(self, query_vectors, top_k: int, hnsw_ef: Optional[int] = None) -> List[List[Document]]:
+        """
+        Search for several query embeddings in one round trip.
+
+        Args:
+            query_vectors: One embedding per query
+            top_k: Number of documents to return per query
+            hnsw_ef: Optional HNSW beam width (higher = better recall, slower)
+
+        Returns:
+            One list of Documents per query, in input order
+        """
+        ...
+
     def as_retriever(self, k: int):
         """
         Create a retriever from the vector store.
@@ -1,12 +1,18 @@
 """Verification Port - Interface for answer verification adapters."""
 
-from typing import Dict, List, Protocol
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
 
 
 class VerificationPort(Protocol):
     """Port for verification implementations (RAGAS, custom metrics, etc.)."""
 
-    def verify(self, question: str, answer: str, contexts: List[str]) -> Dict:
+    def verify(
+        self,
+        question: str,
+        answer: str,
+        contexts: List[str],
+        joined_context_lower: Optional[str] = None,
+    ) -> Dict:
         """
         Verify the quality of an answer given the question and contexts.
 
@@ -14,6 +20,8 @@ class VerificationPort(Protocol):
             question: The user's question
             answer: The generated answer
             contexts: List of context strings used to generate the answer
+            joined_context_lower: Optional contexts already joined into one
+                lowercased string, for adapters that score on the joined text
 
         Returns:
             Dictionary containing verification metrics:
@@ -24,3 +32,21 @@ class VerificationPort(Protocol):
             - issues: List of identified issues
         """
         ...
+
+    def verify_batch(
+        self,
+        items: Sequence[Tuple[str, str, List[str]]],
+        joined_contexts_lower: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[Dict]:
+        """
+        Verify several answers at once.
+
+        Args:
+            items: Sequence of (question, answer, contexts) triples
+            joined_contexts_lower: Optional per-item joined, lowercased contexts
+
+        Returns:
+            One verification dictionary per item, in input order, with the
+            same keys as verify()
+        """
+        ...
@@ -1,19 +1,31 @@
 # test_model.py
-import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+# Manual smoke test for the merged DPO model: run `python src/test_model.py`.
+# torch/transformers are imported and the model loaded only when run directly,
+# so test collection (pytest matches test_*.py) does not pull them in.
 
-print("Loading merged DPO model...")
-model = AutoModelForCausalLM.from_pretrained(
-    "/workspace/taj-merged",
-    torch_dtype=torch.float16,
-    device_map="auto"
-)
-tokenizer = AutoTokenizer.from_pretrained("/workspace/taj-merged")
-model.eval()
+MODEL_PATH = "/workspace/taj-merged"
 
-print("✅ Model loaded!\n")
 
-def ask_taj(question):
+def load_model(path=MODEL_PATH):
+    import torch
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    print("Loading merged DPO model...")
+    model = AutoModelForCausalLM.from_pretrained(
+        path,
+        torch_dtype=torch.float16,
+        device_map="auto"
+    )
+    tokenizer = AutoTokenizer.from_pretrained(path)
+    model.eval()
+
+    print("✅ Model loaded!\n")
+    return model, tokenizer
+
+
+def ask_taj(model, tokenizer, question):
+    import torch
+
     prompt = f"You are an assistant answering questions about Taj Hotels.\n\nQuestion: {question}\n\nAnswer:"
     inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
     
@@ -28,21 +40,29 @@ def ask_taj(question):
     text = tokenizer.decode(outputs[0], skip_special_tokens=True)
     return text.split("Answer:")[-1].strip()
 
-# Test
-print("="*70)
-print("TESTING DPO FINE-TUNED MODEL")
-print("="*70 + "\n")
 
-questions = [
-    "How much does a night at Taj Mahal Palace, Mumbai typically cost?",
-    "What is the average price range for Taj Mahal Palace, Mumbai?",
-    "How much does Taj Lake Palace Udaipur cost per night?",
-]
+def main():
+    model, tokenizer = load_model()
+
+    # Test
+    print("="*70)
+    print("TESTING DPO FINE-TUNED MODEL")
+    print("="*70 + "\n")
+
+    questions = [
+        "How much does a night at Taj Mahal Palace, Mumbai typically cost?",
+        "What is the average price range for Taj Mahal Palace, Mumbai?",
+        "How much does Taj Lake Palace Udaipur cost per night?",
+    ]
+
+    for i, q in enumerate(questions, 1):
+        answer = ask_taj(model, tokenizer, q)
+        print(f"Q{i}: {q}")
+        print(f"A{i}: {answer}")
+        print("-"*70 + "\n")
+
+    print("\n✅ If you see ₹24,000-65,000 for Mumbai, YOUR DPO TRAINING WORKED!")
 
-for i, q in enumerate(questions, 1):
-    answer = ask_taj(q)
-    print(f"Q{i}: {q}")
-    print(f"A{i}: {answer}")
-    print("-"*70 + "\n")
 
-print("\n✅ If you see ₹24,000-65,000 for Mumbai, YOUR DPO TRAINING WORKED!")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
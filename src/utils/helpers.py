@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import io
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Tuple
 
 
 def load_pdf_bytes(uploaded_file: Any) -> bytes:
-    """Read bytes from a Streamlit UploadedFile-like object."""
+    """
+    Read bytes from a Streamlit UploadedFile-like object.
+
+    Streamlit's UploadedFile is an in-memory BytesIO over the upload's bytes;
+    getvalue() hands back that buffer without copying and regardless of the
+    current read position (which may sit at EOF after an earlier read).
+    """
+    if isinstance(uploaded_file, io.BytesIO):
+        return uploaded_file.getvalue()
     if hasattr(uploaded_file, "read"):
         return uploaded_file.read()
     if isinstance(uploaded_file, (bytes, bytearray)):
@@ -26,7 +35,12 @@ def prepare_uploads(files) -> List[Tuple[str, bytes]]:
     Returns:
         List of (filename, file_bytes) tuples
     """
-    uploads: List[Tuple[str, bytes]] = []
-    for f in files:
-        uploads.append((f.name, load_pdf_bytes(f)))
-    return uploads
+    files = list(files)
+    # In-memory uploads are returned without I/O; only real file reads are
+    # worth overlapping on threads (they release the GIL while reading).
+    if sum(not isinstance(f, io.BytesIO) for f in files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            blobs = list(executor.map(load_pdf_bytes, files))
+    else:
+        blobs = [load_pdf_bytes(f) for f in files]
+    return [(f.name, blob) for f, blob in zip(files, blobs)]
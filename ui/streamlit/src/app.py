@@ -382,7 +382,7 @@ def main():
                     with st.spinner("📄 Processing PDF..."):
                         try:
                             result = st.session_state.api_client.ingest_document(
-                                file_bytes=uploaded_file.read(),
+                                file_obj=uploaded_file,
                                 filename=uploaded_file.name
                             )
                             st.success(f"✅ Successfully processed {uploaded_file.name}!")
@@ -44,12 +44,9 @@ def render():
             if st.button("🚀 Upload & Process", type="primary", use_container_width=True):
                 with st.spinner("📤 Uploading and processing document..."):
                     try:
-                        # Read file bytes
-                        file_bytes = uploaded_file.read()
-                        
-                        # Call API
+                        # Call API (the upload is streamed from the file object)
                         result = st.session_state.api_client.ingest_document(
-                            file_bytes=file_bytes,
+                            file_obj=uploaded_file,
                             filename=uploaded_file.name
                         )
                         
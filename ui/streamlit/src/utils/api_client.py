@@ -8,14 +8,73 @@ Provides:
 - Ground truth management
 """
 
+import io
+import json
 import os
+import threading
+import time
 import requests
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from typing import BinaryIO, Dict, Any, Iterator, List, Optional, Union
+from urllib3.util.retry import Retry
 import streamlit as st
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # optional: without it requests builds the whole multipart body in memory
+    MultipartEncoder = None
+
+try:
+    import ijson
+except ImportError:  # optional: without it entry pages are parsed in one json() call
+    ijson = None
+
+
+# POST endpoints mounted on a session adapter without retries
+_NON_IDEMPOTENT_PATHS = ("/api/ask", "/api/ingest", "/api/export")
+
+# Optional /api/entries query filters, in get_entries() argument order;
+# list values (domains) are sent as repeated query keys by requests
+_ENTRY_FILTERS = ("file_name", "min_verification_score", "min_reward_score", "domains")
+
+
+class _TTLCache:
+    """Thread-safe in-process cache of GET responses with per-entry expiry."""
+
+    def __init__(self):
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop cached responses whose path starts with ``prefix`` (all when empty)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0].startswith(prefix)]:
+                del self._entries[key]
+
 
 class APIClient:
-    """Client for API Gateway communication."""
+    """
+    Client for API Gateway communication.
+    
+    Slow-changing listings (collection info, datasets, domains) are served
+    from a short-lived in-process cache so Streamlit reruns do not refetch
+    them; the client's own writes invalidate the affected entries.
+    """
     
     def __init__(self, base_url: Optional[str] = None):
         """
@@ -25,6 +84,60 @@ class APIClient:
             base_url: API Gateway base URL (default: from env or localhost)
         """
         self.base_url = base_url or os.getenv("API_GATEWAY_URL", "http://localhost:8000")
+
+        # One keep-alive session so back-to-back dashboard calls reuse the
+        # gateway connection instead of a new TCP/TLS handshake per request.
+        # Only idempotent GET/HEAD requests are retried, with exponential
+        # backoff, on 429/502/503/504.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.25,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                # Hand the last response to raise_for_status() (HTTPError, as
+                # before) instead of raising RetryError when retries run out
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Generation, ingestion and export are not safe to replay, not even
+        # after a connection error; the longest matching prefix wins.
+        no_retry = HTTPAdapter(pool_maxsize=20, max_retries=0)
+        for path in _NON_IDEMPOTENT_PATHS:
+            self.session.mount(f"{self.base_url}{path}", no_retry)
+        self.session.headers.update({"Accept": "application/json", "User-Agent": "rlvr-streamlit/1.0"})
+        self._cache = _TTLCache()
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        Drop cached GET responses.
+
+        Args:
+            prefix: API path prefix to invalidate (e.g. "/api/datasets"); all when empty
+        """
+        self._cache.invalidate(prefix)
+
+    def _cached_get(self, path: str, ttl: float, timeout: float = 10) -> Any:
+        """GET ``path`` as JSON, reusing a response fetched within the last ``ttl`` seconds."""
+        key = (path,)
+        cached = self._cache.get(key)
+        if cached is None:
+            response = self.session.get(f"{self.base_url}{path}", timeout=timeout)
+            response.raise_for_status()
+            cached = response.content
+            self._cache.set(key, cached, ttl)
+        # Cache the raw body and parse per call, so callers that mutate the
+        # result cannot corrupt it for other sessions sharing this client
+        return json.loads(cached)
     
     # ========================================================================
     # Health Check
@@ -38,7 +151,7 @@ class APIClient:
             Health status dictionary
         """
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
+            response = self.session.get(f"{self.base_url}/health", timeout=5)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -63,7 +176,7 @@ class APIClient:
         Returns:
             Answer dictionary with question, answer, contexts, event_id
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/ask",
             json={"question": question, "collection_name": collection_name},
             timeout=120  # 2 minutes for LLM generation
@@ -105,7 +218,7 @@ class APIClient:
         if num_candidates is not None:
             payload["num_candidates"] = num_candidates
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/ask/multi-candidate",
             json=payload,
             timeout=180  # 3 minutes for multiple LLM generations
@@ -117,36 +230,50 @@ class APIClient:
     # Document Ingestion
     # ========================================================================
     
-    def ingest_document(self, file_bytes: bytes, filename: str) -> Dict[str, Any]:
+    def ingest_document(self, file_obj: Union[BinaryIO, bytes], filename: str) -> Dict[str, Any]:
         """
         Ingest a PDF document.
         
+        The file is streamed into the multipart request body when
+        requests-toolbelt is installed, instead of being copied into one
+        in-memory body first. Streamlit's UploadedFile can be passed as is.
+        
         Args:
-            file_bytes: PDF file bytes
+            file_obj: Readable binary file object (or raw PDF bytes)
             filename: File name
             
         Returns:
             Ingestion result dictionary
         """
-        files = {"file": (filename, file_bytes, "application/pdf")}
-        response = requests.post(
+        if isinstance(file_obj, (bytes, bytearray, memoryview)):
+            file_obj = io.BytesIO(file_obj)
+        elif hasattr(file_obj, "seek"):
+            file_obj.seek(0)
+        
+        field = (filename, file_obj, "application/pdf")
+        if MultipartEncoder is not None:
+            encoder = MultipartEncoder(fields={"file": field})
+            request_kwargs = {"data": encoder, "headers": {"Content-Type": encoder.content_type}}
+        else:
+            request_kwargs = {"files": {"file": field}}
+        response = self.session.post(
             f"{self.base_url}/api/ingest",
-            files=files,
-            timeout=300  # 5 minutes for large PDFs
+            timeout=300,  # 5 minutes for large PDFs
+            **request_kwargs
         )
         response.raise_for_status()
+        self.invalidate("/api/collection")
+        self.invalidate("/api/datasets")
         return response.json()
     
     def get_collection_info(self) -> Dict[str, Any]:
         """
-        Get vector store collection info.
+        Get vector store collection info (cached for 30 s).
         
         Returns:
             Collection info dictionary
         """
-        response = requests.get(f"{self.base_url}/api/collection/info", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("/api/collection/info", ttl=30)
     
     # ========================================================================
     # Training Data
@@ -154,18 +281,16 @@ class APIClient:
     
     def list_datasets(self) -> Dict[str, Any]:
         """
-        List all training datasets.
+        List all training datasets (cached for 15 s).
         
         Returns:
             Datasets list with statistics
         """
-        response = requests.get(f"{self.base_url}/api/datasets", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("/api/datasets", ttl=15)
     
     def get_dataset_stats(self, file_name: str) -> Dict[str, Any]:
         """
-        Get statistics for a specific dataset.
+        Get statistics for a specific dataset (cached for 15 s).
         
         Args:
             file_name: Dataset file name
@@ -173,12 +298,7 @@ class APIClient:
         Returns:
             Dataset statistics
         """
-        response = requests.get(
-            f"{self.base_url}/api/datasets/{file_name}/stats",
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"/api/datasets/{file_name}/stats", ttl=15)
     
     def get_entries(
         self,
@@ -203,19 +323,52 @@ class APIClient:
         Returns:
             List of training data entries
         """
-        params = {"limit": limit, "offset": offset}
-        if file_name:
-            params["file_name"] = file_name
-        if min_verification_score is not None:
-            params["min_verification_score"] = min_verification_score
-        if min_reward_score is not None:
-            params["min_reward_score"] = min_reward_score
-        if domains:
-            params["domains"] = domains
+        return list(self.iter_entries(
+            file_name=file_name,
+            min_verification_score=min_verification_score,
+            min_reward_score=min_reward_score,
+            domains=domains,
+            limit=limit,
+            offset=offset,
+        ))
+
+    def iter_entries(
+        self,
+        file_name: Optional[str] = None,
+        min_verification_score: Optional[float] = None,
+        min_reward_score: Optional[float] = None,
+        domains: Optional[List[str]] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield training data entries as they are parsed from the response.
         
-        response = requests.get(f"{self.base_url}/api/entries", params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        With ijson installed the page is parsed incrementally from the
+        response stream, so the first entries can be rendered before the
+        rest has arrived (e.g. via itertools.islice). Takes the same
+        filters as get_entries().
+        
+        Yields:
+            Training data entries
+        """
+        filters = (file_name, min_verification_score, min_reward_score, domains)
+        params = {
+            "limit": limit,
+            "offset": offset,
+            **{key: value for key, value in zip(_ENTRY_FILTERS, filters) if value not in (None, "", [])},
+        }
+        
+        with self.session.get(
+            f"{self.base_url}/api/entries", params=params, timeout=30, stream=ijson is not None
+        ) as response:
+            response.raise_for_status()
+            if ijson is None:
+                yield from response.json()
+                return
+            # Let urllib3 undo gzip/deflate on the raw stream
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "item", use_float=True)
 
     def export_dataset(
         self,
@@ -244,8 +397,9 @@ class APIClient:
         if domains:
             payload["domains"] = domains
 
-        response = requests.post(f"{self.base_url}/api/export", json=payload, timeout=60)
+        response = self.session.post(f"{self.base_url}/api/export", json=payload, timeout=60)
         response.raise_for_status()
+        self.invalidate("/api/datasets")
         return response.json()
 
     # ========================================================================
@@ -254,14 +408,12 @@ class APIClient:
 
     def list_domains(self) -> Dict[str, Any]:
         """
-        List all ground truth domains.
+        List all ground truth domains (cached for 60 s).
 
         Returns:
             Domains list
         """
-        response = requests.get(f"{self.base_url}/api/ground-truth/domains", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("/api/ground-truth/domains", ttl=60)
 
     def create_domain(
         self,
@@ -285,12 +437,13 @@ class APIClient:
             "description": description,
             "metadata_schema": metadata_schema
         }
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/ground-truth/domains",
             json=payload,
             timeout=10
         )
         response.raise_for_status()
+        self.invalidate("/api/ground-truth/domains")
         return response.json()
 
     def list_ground_truth_entries(
@@ -311,7 +464,7 @@ class APIClient:
             List of ground truth entries
         """
         params = {"limit": limit, "offset": offset}
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/ground-truth/{domain}/entries",
             params=params,
             timeout=10
@@ -343,12 +496,14 @@ class APIClient:
             "expected_answer": expected_answer,
             "metadata": metadata or {}
         }
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/ground-truth/{domain}/entries",
             json=payload,
             timeout=10
         )
         response.raise_for_status()
+        # Domain listings may carry per-domain entry counts
+        self.invalidate("/api/ground-truth/domains")
         return response.json()
 
 
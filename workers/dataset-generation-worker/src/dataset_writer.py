@@ -16,6 +16,18 @@ from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency handling
+    orjson = None
+
+
+def _dumps_line(obj: Dict) -> bytes:
+    """Serialize ``obj`` as one UTF-8 JSONL line (newline included)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 # Quality filters for DPO pairs
 HEDGING_PHRASES = [
@@ -67,22 +79,36 @@ class DatasetWriter:
         Args:
             entry: Complete entry with answer, verification, and reward data
         """
+        self.write_entries_batch([entry])
+    
+    def write_entries_batch(self, entries: List[Dict]) -> None:
+        """
+        Write several complete entries to the monthly JSONL file in one write.
+        
+        Args:
+            entries: Complete entries with answer, verification, and reward data
+        """
+        if not entries:
+            return
         try:
             # Create monthly file
             month_str = datetime.now().strftime("%Y%m")
             output_file = self.output_dir / f"training_data_{month_str}.jsonl"
             
-            # Format entry for training
-            training_entry = self._format_training_entry(entry)
+            # Format entries for training
+            lines = b"".join(_dumps_line(self._format_training_entry(entry)) for entry in entries)
             
             # Append to JSONL file
-            with output_file.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(training_entry, ensure_ascii=False) + "\n")
+            with output_file.open("ab") as f:
+                f.write(lines)
             
-            logger.info(f"Wrote entry to {output_file.name}: {entry['question'][:50]}...")
+            if len(entries) == 1:
+                logger.info(f"Wrote entry to {output_file.name}: {entries[0]['question'][:50]}...")
+            else:
+                logger.info(f"Wrote {len(entries)} entries to {output_file.name}")
             
         except Exception as e:
-            logger.error(f"Failed to write entry: {e}", exc_info=True)
+            logger.error(f"Failed to write {len(entries)} entries: {e}", exc_info=True)
     
     def _format_training_entry(self, entry: Dict) -> Dict:
         """
@@ -186,6 +212,9 @@ class DPODatasetWriter:
         # Also store by question (for backward compatibility)
         self.answers_by_question: Dict[str, List[Dict]] = defaultdict(list)
 
+        # Serialized pairs collected during add_entries_batch(), written in one go
+        self._batch_lines: Optional[List[bytes]] = None
+
         # Statistics
         self.stats = {
             "total_pairs_attempted": 0,
@@ -227,6 +256,22 @@ class DPODatasetWriter:
             # Single answer or legacy mode - try immediately
             self._try_create_dpo_pairs(question)
 
+    def add_entries_batch(self, entries: List[Dict]) -> None:
+        """
+        Add several training entries, writing any DPO pairs they complete in one write.
+
+        Args:
+            entries: Complete training entries with verification scores
+        """
+        self._batch_lines = []
+        try:
+            for entry in entries:
+                self.add_entry(entry)
+        finally:
+            lines, self._batch_lines = self._batch_lines, None
+            if lines:
+                self._append_lines(lines)
+
     def _is_hedging_answer(self, answer: str) -> bool:
         """
         Check if answer contains hedging/evasive language.
@@ -437,10 +482,6 @@ class DPODatasetWriter:
             score_diff: Score difference between chosen and rejected
         """
         try:
-            # Create monthly file
-            month_str = datetime.now().strftime("%Y%m")
-            output_file = self.output_dir / f"dpo_data_{month_str}.jsonl"
-
             # Build prompt (just the question, context is in the answer)
             question = chosen_entry["question"]
 
@@ -456,10 +497,13 @@ class DPODatasetWriter:
                     "num_candidates": len(self.answers_by_question[question])
                 }
             }
+            line = _dumps_line(dpo_entry)
 
-            # Append to JSONL file
-            with output_file.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(dpo_entry, ensure_ascii=False) + "\n")
+            # Append to JSONL file (deferred to the end of add_entries_batch)
+            if self._batch_lines is not None:
+                self._batch_lines.append(line)
+            else:
+                self._append_lines([line])
 
             self.stats["pairs_created"] += 1
 
@@ -475,6 +519,16 @@ class DPODatasetWriter:
         except Exception as e:
             logger.error(f"Failed to write DPO pair: {e}", exc_info=True)
 
+    def _append_lines(self, lines: List[bytes]) -> None:
+        """Append serialized DPO pairs to the monthly JSONL file."""
+        try:
+            month_str = datetime.now().strftime("%Y%m")
+            output_file = self.output_dir / f"dpo_data_{month_str}.jsonl"
+            with output_file.open("ab") as f:
+                f.write(b"".join(lines))
+        except Exception as e:
+            logger.error(f"Failed to write {len(lines)} DPO pair(s): {e}", exc_info=True)
+
     def _log_statistics(self) -> None:
         """Log DPO pair creation statistics."""
         total = self.stats["total_pairs_attempted"]
@@ -9,8 +9,9 @@ Combines:
 Into complete training data entries.
 """
 
+import heapq
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -36,12 +37,24 @@ class EventAggregator:
         # Storage: key = (question, answer), value = dict of events
         self.pending_entries: Dict[tuple, Dict] = {}
         
+        # Min-heap of (expiry time, key) so cleanup only visits expired entries.
+        # Keys completed or re-created since are skipped lazily on pop.
+        self._expiry_heap: List[Tuple[datetime, tuple]] = []
+        
         logger.info(f"Event Aggregator initialized (timeout={timeout_minutes}m)")
     
     def _get_key(self, question: str, answer: str) -> tuple:
         """Generate unique key for question+answer pair."""
         return (question.strip(), answer.strip())
     
+    def _expires_at(self, entry: Dict) -> datetime:
+        """Time after which a pending entry is considered expired."""
+        return datetime.fromisoformat(entry["timestamp"]) + timedelta(minutes=self.timeout_minutes)
+    
+    def _track_expiry(self, key: tuple) -> None:
+        """Index a newly created pending entry by its expiry time."""
+        heapq.heappush(self._expiry_heap, (self._expires_at(self.pending_entries[key]), key))
+    
     def add_answer_generated(self, event) -> Optional[Dict]:
         """
         Add answer.generated event.
@@ -69,6 +82,7 @@ class EventAggregator:
                 "total_candidates": getattr(event, "total_candidates", None),
                 "temperature": getattr(event, "temperature", None),
             }
+            self._track_expiry(key)
         else:
             # Update if not already set
             entry = self.pending_entries[key]
@@ -102,6 +116,7 @@ class EventAggregator:
                 "answer": event.answer,
                 "timestamp": event.timestamp,
             }
+            self._track_expiry(key)
         
         # Add verification data
         entry = self.pending_entries[key]
@@ -133,6 +148,7 @@ class EventAggregator:
                 "answer": event.answer,
                 "timestamp": event.timestamp,
             }
+            self._track_expiry(key)
         
         # Add reward data
         entry = self.pending_entries[key]
@@ -185,19 +201,19 @@ class EventAggregator:
             Number of entries removed
         """
         now = datetime.utcnow()
-        timeout_delta = timedelta(minutes=self.timeout_minutes)
-        
-        expired_keys = []
-        for key, entry in self.pending_entries.items():
-            entry_time = datetime.fromisoformat(entry["timestamp"])
-            if now - entry_time > timeout_delta:
-                expired_keys.append(key)
         
-        for key in expired_keys:
-            logger.warning(f"Removing expired entry: {self.pending_entries[key]['question'][:50]}...")
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, key = heapq.heappop(self._expiry_heap)
+            entry = self.pending_entries.get(key)
+            # Skip keys already completed, or re-created with a later expiry
+            if entry is None or self._expires_at(entry) >= now:
+                continue
+            logger.warning(f"Removing expired entry: {entry['question'][:50]}...")
             del self.pending_entries[key]
+            removed += 1
         
-        return len(expired_keys)
+        return removed
     
     def get_stats(self) -> Dict:
         """Get statistics about pending entries."""
@@ -5,14 +5,26 @@ This worker:
 1. Consumes answer.generated, verification.completed, and reward.computed events
 2. Aggregates related events by question+answer
 3. Writes complete entries to JSONL training data files
+
+Delivery is at-most-once: events are acked once a processing thread takes them
+off the in-memory queue, before aggregation, and complete entries are written
+by a background flusher. Acks cannot wait for the write, because a partial
+aggregation can wait minutes for its other events, and holding those messages
+unacked would stall the prefetch window. A clean shutdown (SIGTERM/Ctrl-C) drains everything buffered
+before the final acks are sent; a crash or OOM kill loses the events acked but
+not yet written.
 """
 
 import os
 import sys
+import atexit
 import logging
+import queue
+import signal
 import time
 import threading
-from typing import Dict, Any
+from collections import Counter, deque
+from typing import Callable, Deque, Dict, Any, List, Optional
 
 # Add shared directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
@@ -33,6 +45,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Complete entries are buffered and written by a background flusher
+FLUSH_INTERVAL_SECONDS = 0.25
+FLUSH_BATCH_SIZE = 500
+
+# Events handed from the AMQP thread to the processing threads
+WORK_QUEUE_SIZE = 10000
+NUM_PROCESSING_THREADS = 2
+
+# Let the broker keep many messages in flight and ack them in batches
+PREFETCH_COUNT = 200
+ACK_BATCH_SIZE = 50
+
+# Queued events stay unacked, so the broker never has more than PREFETCH_COUNT
+# of them outstanding and enqueue_event() never blocks the AMQP thread. The
+# spare room covers redeliveries queued after a reconnect.
+assert PREFETCH_COUNT < WORK_QUEUE_SIZE, "WORK_QUEUE_SIZE must exceed PREFETCH_COUNT"
+
+# Queued in place of an event to stop a processing thread
+_STOP = object()
+
+STAT_NAMES = ("answer_events", "verification_events", "reward_events", "complete_entries", "expired_entries")
+
 
 class DatasetGenerationWorker:
     """
@@ -73,6 +107,8 @@ class DatasetGenerationWorker:
 
         # Initialize aggregator and writers
         self.aggregator = EventAggregator(timeout_minutes=timeout_minutes)
+        # The aggregator is shared by the processing and cleanup threads
+        self._aggregator_lock = threading.Lock()
         self.writer = DatasetWriter(output_dir=output_dir)
         self.dpo_writer = DPODatasetWriter(
             output_dir=dpo_output_dir,
@@ -83,28 +119,69 @@ class DatasetGenerationWorker:
         
         # Initialize event consumers (one per event type)
         self.consumers = []
-        
-        # Statistics
-        self.stats = {
-            "answer_events": 0,
-            "verification_events": 0,
-            "reward_events": 0,
-            "complete_entries": 0,
-            "expired_entries": 0,
+
+        # (event, ack) pairs received on the AMQP thread, processed by worker threads
+        self._work_q: "queue.Queue[Any]" = queue.Queue(maxsize=WORK_QUEUE_SIZE)
+
+        # Event class -> handler, looked up once per message
+        self._dispatch = {
+            AnswerGeneratedEvent: self.process_answer_generated,
+            VerificationCompletedEvent: self.process_verification_completed,
+            RewardComputedEvent: self.process_reward_computed,
         }
+
+        # Complete entries waiting for the flusher thread
+        self._pending: Deque[Dict] = deque()
+        self._pending_lock = threading.Lock()
+        self._pending_ready = threading.Condition(self._pending_lock)
+        # Serializes writer access between the flusher and shutdown drain
+        self._flush_lock = threading.Lock()
+
+        # Background threads, stopped and joined by drain_pending_entries()
+        self._processing_threads: List[threading.Thread] = []
+        self._flusher_thread: Optional[threading.Thread] = None
+        self._stop_flushing = threading.Event()
+        self._drain_lock = threading.Lock()
+        
+        # Statistics: each thread counts into its own Counter, summed on read
+        self._local = threading.local()
+        self._thread_stats: List[Counter] = []
+        self._thread_stats_lock = threading.Lock()
         
         logger.info("Dataset Generation Worker initialized")
     
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the worker counters summed across threads."""
+        totals = dict.fromkeys(STAT_NAMES, 0)
+        with self._thread_stats_lock:
+            per_thread = list(self._thread_stats)
+        for counts in per_thread:
+            for name, value in dict(counts).items():
+                totals[name] += value
+        return totals
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Increment a counter without contending with other threads."""
+        counts = getattr(self._local, "stats", None)
+        if counts is None:
+            counts = self._local.stats = Counter()
+            with self._thread_stats_lock:
+                self._thread_stats.append(counts)
+        counts[name] += amount
+
     def process_answer_generated(self, event: AnswerGeneratedEvent) -> None:
         """Process answer.generated event."""
         try:
-            correlation_id = getattr(event, 'correlation_id', 'N/A')
-            batch_id = getattr(event, 'batch_id', 'N/A')
-
-            logger.debug(f"[correlation_id={correlation_id}] [batch_id={batch_id}] Received answer.generated: {event.event_id}")
-            self.stats["answer_events"] += 1
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[correlation_id=%s] [batch_id=%s] Received answer.generated: %s",
+                    getattr(event, 'correlation_id', 'N/A'), getattr(event, 'batch_id', 'N/A'), event.event_id
+                )
+            self._count("answer_events")
 
-            complete_entry = self.aggregator.add_answer_generated(event)
+            with self._aggregator_lock:
+                complete_entry = self.aggregator.add_answer_generated(event)
 
             if complete_entry:
                 self._write_complete_entry(complete_entry)
@@ -115,12 +192,15 @@ class DatasetGenerationWorker:
     def process_verification_completed(self, event: VerificationCompletedEvent) -> None:
         """Process verification.completed event."""
         try:
-            correlation_id = getattr(event, 'correlation_id', 'N/A')
-
-            logger.debug(f"[correlation_id={correlation_id}] Received verification.completed: {event.event_id}")
-            self.stats["verification_events"] += 1
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[correlation_id=%s] Received verification.completed: %s",
+                    getattr(event, 'correlation_id', 'N/A'), event.event_id
+                )
+            self._count("verification_events")
 
-            complete_entry = self.aggregator.add_verification_completed(event)
+            with self._aggregator_lock:
+                complete_entry = self.aggregator.add_verification_completed(event)
 
             if complete_entry:
                 self._write_complete_entry(complete_entry)
@@ -131,10 +211,11 @@ class DatasetGenerationWorker:
     def process_reward_computed(self, event: RewardComputedEvent) -> None:
         """Process reward.computed event."""
         try:
-            logger.debug(f"Received reward.computed: {event.event_id}")
-            self.stats["reward_events"] += 1
+            logger.debug("Received reward.computed: %s", event.event_id)
+            self._count("reward_events")
             
-            complete_entry = self.aggregator.add_reward_computed(event)
+            with self._aggregator_lock:
+                complete_entry = self.aggregator.add_reward_computed(event)
             
             if complete_entry:
                 self._write_complete_entry(complete_entry)
@@ -143,42 +224,146 @@ class DatasetGenerationWorker:
             logger.error(f"Error processing reward.computed: {e}", exc_info=True)
     
     def _write_complete_entry(self, entry: Dict) -> None:
-        """Write complete entry to dataset and try to create DPO pairs."""
+        """Queue complete entry for the flusher thread to write in a batch."""
+        with self._pending_ready:
+            self._pending.append(entry)
+            if len(self._pending) >= FLUSH_BATCH_SIZE:
+                self._pending_ready.notify()
+
+    def _take_pending(self) -> List[Dict]:
+        """Pop up to FLUSH_BATCH_SIZE queued entries (caller holds the lock)."""
+        count = min(len(self._pending), FLUSH_BATCH_SIZE)
+        return [self._pending.popleft() for _ in range(count)]
+
+    def _write_batch(self, entries: List[Dict]) -> None:
+        """Write a batch of complete entries to the dataset and try to create DPO pairs."""
+        if not entries:
+            return
         try:
-            # Write standard training data
-            self.writer.write_entry(entry)
-            self.stats["complete_entries"] += 1
+            with self._flush_lock:
+                # Write standard training data
+                self.writer.write_entries_batch(entries)
+                self._count("complete_entries", len(entries))
 
-            # Try to create DPO pairs
-            self.dpo_writer.add_entry(entry)
+                # Try to create DPO pairs
+                self.dpo_writer.add_entries_batch(entries)
 
+            stats = self.stats
             logger.info(
-                f"Complete entry written! "
-                f"Total: {self.stats['complete_entries']} "
-                f"(answer={self.stats['answer_events']}, "
-                f"verification={self.stats['verification_events']}, "
-                f"reward={self.stats['reward_events']})"
+                f"{len(entries)} complete entries written! "
+                f"Total: {stats['complete_entries']} "
+                f"(answer={stats['answer_events']}, "
+                f"verification={stats['verification_events']}, "
+                f"reward={stats['reward_events']})"
             )
 
         except Exception as e:
-            logger.error(f"Error writing complete entry: {e}", exc_info=True)
-    
+            logger.error(f"Error writing complete entries: {e}", exc_info=True)
+
+    def flush_pending_entries(self):
+        """Periodically write buffered complete entries in batches until stopped."""
+        while not self._stop_flushing.is_set():
+            with self._pending_ready:
+                if len(self._pending) < FLUSH_BATCH_SIZE:
+                    self._pending_ready.wait(timeout=FLUSH_INTERVAL_SECONDS)
+                batch = self._take_pending()
+            self._write_batch(batch)
+
+    def _dispatch_event(self, event) -> None:
+        """Hand event to its type's handler."""
+        handler = self._dispatch.get(type(event))
+        if handler:
+            handler(event)
+        else:
+            logger.warning(f"Unknown event type: {type(event)}")
+
+    def process_queued_events(self):
+        """Aggregate and write events queued by the AMQP consumer."""
+        while True:
+            item = self._work_q.get()
+            if item is _STOP:
+                self._work_q.task_done()
+                return
+            event, ack = item
+            try:
+                # Queue order matches delivery order, so a batched ack never covers a queued event
+                ack()
+                self._dispatch_event(event)
+            except Exception as e:
+                logger.error(f"Error processing queued event: {e}", exc_info=True)
+            finally:
+                self._work_q.task_done()
+
+    def enqueue_event(self, event, ack: Callable[[], None]) -> None:
+        """
+        Queue event for the processing threads without blocking the AMQP thread.
+
+        The message is acked when a processing thread takes it, so the queue is
+        bounded by PREFETCH_COUNT and put_nowait() does not raise queue.Full.
+        """
+        self._work_q.put_nowait((event, ack))
+
+    def drain_pending_entries(self) -> None:
+        """
+        Stop the background threads and write every buffered entry (used on shutdown).
+
+        The processing threads and the flusher are joined first, so an event a
+        processing thread has dequeued or a batch the flusher has taken is
+        written before the final loop runs. Safe to call more than once.
+        """
+        with self._drain_lock:
+            # Each processing thread exits at its sentinel, after the events queued ahead of it
+            threads, self._processing_threads = self._processing_threads, []
+            for _ in threads:
+                self._work_q.put(_STOP)
+            for thread in threads:
+                thread.join()
+
+            flusher, self._flusher_thread = self._flusher_thread, None
+            if flusher is not None:
+                self._stop_flushing.set()
+                with self._pending_ready:
+                    self._pending_ready.notify()
+                flusher.join()
+
+            # Events left if the processing threads never started
+            while True:
+                try:
+                    item = self._work_q.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    if item is not _STOP:
+                        event, ack = item
+                        ack()
+                        self._dispatch_event(event)
+                finally:
+                    self._work_q.task_done()
+            while True:
+                with self._pending_lock:
+                    batch = self._take_pending()
+                if not batch:
+                    return
+                self._write_batch(batch)
+
     def cleanup_expired_entries(self):
         """Periodically cleanup expired entries."""
         while True:
             try:
                 time.sleep(self.cleanup_interval_seconds)
                 
-                expired = self.aggregator.cleanup_expired()
+                with self._aggregator_lock:
+                    expired = self.aggregator.cleanup_expired()
                 if expired > 0:
-                    self.stats["expired_entries"] += expired
+                    self._count("expired_entries", expired)
                     logger.warning(f"Cleaned up {expired} expired entries")
                 
                 # Log statistics
+                stats = self.stats
                 logger.info(
-                    f"Stats: {self.stats['complete_entries']} complete, "
+                    f"Stats: {stats['complete_entries']} complete, "
                     f"{self.aggregator.get_stats()['pending_entries']} pending, "
-                    f"{self.stats['expired_entries']} expired"
+                    f"{stats['expired_entries']} expired"
                 )
                 
             except Exception as e:
@@ -192,6 +377,24 @@ class DatasetGenerationWorker:
         cleanup_thread = threading.Thread(target=self.cleanup_expired_entries, daemon=True)
         cleanup_thread.start()
         logger.info("Cleanup thread started")
+
+        # Start flusher thread; the consumer drains whatever is left once consuming stops
+        self._flusher_thread = threading.Thread(target=self.flush_pending_entries, daemon=True)
+        self._flusher_thread.start()
+        atexit.register(self.drain_pending_entries)
+        # SIGTERM takes the consumer's Ctrl-C path (stop consuming and return);
+        # draining in the handler could deadlock on a lock the main thread holds
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        logger.info("Flusher thread started")
+
+        # Start processing threads so aggregation and disk I/O stay off the AMQP thread
+        for i in range(NUM_PROCESSING_THREADS):
+            thread = threading.Thread(
+                target=self.process_queued_events, name=f"event-processor-{i}", daemon=True
+            )
+            thread.start()
+            self._processing_threads.append(thread)
+        logger.info(f"{NUM_PROCESSING_THREADS} processing threads started")
         
         # Create consumers for each event type
         logger.info("Creating event consumers...")
@@ -203,37 +406,19 @@ class DatasetGenerationWorker:
         # For now, we'll consume all events from a single queue
         # and route them based on event_type
         
-        consumer = EventConsumer(rabbitmq_url=self.rabbitmq_url)
-
-        def route_event(event):
-            """Route event to appropriate handler based on type."""
-            if isinstance(event, AnswerGeneratedEvent):
-                self.process_answer_generated(event)
-            elif isinstance(event, VerificationCompletedEvent):
-                self.process_verification_completed(event)
-            elif isinstance(event, RewardComputedEvent):
-                self.process_reward_computed(event)
-            else:
-                logger.warning(f"Unknown event type: {type(event)}")
-
-        # Subscribe to all relevant events using wildcard routing key
-        logger.info("Subscribing to events: answer.*, verification.*, reward.*")
-
-        # Subscribe to all event types using decorator
-        @consumer.subscribe("answer.generated")
-        def handle_answer(event):
-            route_event(event)
-
-        @consumer.subscribe("verification.completed")
-        def handle_verification(event):
-            route_event(event)
+        consumer = EventConsumer(
+            rabbitmq_url=self.rabbitmq_url,
+            prefetch_count=PREFETCH_COUNT,
+            ack_batch_size=ACK_BATCH_SIZE
+        )
 
-        @consumer.subscribe("reward.computed")
-        def handle_reward(event):
-            route_event(event)
+        # One handler bound to every routing key this worker aggregates
+        logger.info("Subscribing to events: answer.generated, verification.completed, reward.computed")
+        for routing_key in ("answer.generated", "verification.completed", "reward.computed"):
+            consumer.subscribe(routing_key, manual_ack=True)(self.enqueue_event)
 
-        # Start consuming
-        consumer.start()
+        # Start consuming; buffered entries are written before the final acks
+        consumer.start(on_stop=self.drain_pending_entries)
 
 
 def main():
@@ -262,8 +447,12 @@ def main():
         enable_quality_filter=enable_quality_filter
     )
 
-    # Start consuming events
-    worker.start()
+    # Start consuming events; on shutdown write everything still buffered
+    try:
+        worker.start()
+    finally:
+        logger.info("Consumer stopped, flushing pending entries...")
+        worker.drain_pending_entries()
 
 
 if __name__ == "__main__":